@@ -145,7 +145,12 @@ GROUP BY af.ansi_code, af.name
 ORDER BY codigo_ansi;
 
 -- REL06: Relés Completo
-CREATE OR REPLACE VIEW protec_ai.vw_relays_complete AS
+-- Agregação pesada (5 JOINs + COUNT DISTINCT) materializada no servidor;
+-- atualizada por DatabaseLoader.load_all após cada carga (REFRESH ... CONCURRENTLY).
+-- DROP + CREATE: reexecutar este script aplica alterações na definição
+-- (CASCADE remove vw_relays_complete, recriada logo abaixo).
+DROP MATERIALIZED VIEW IF EXISTS protec_ai.mv_relays_complete CASCADE;
+CREATE MATERIALIZED VIEW protec_ai.mv_relays_complete AS
 SELECT 
     r.id as relay_id,
     r.bay_identifier,
@@ -199,7 +204,15 @@ GROUP BY r.id, r.bay_identifier, r.relay_type, r.voltage_class_kv,
          r.substation_code, r.config_date, r.software_version,
          m.name, rm.model_name, rm.software_version,
          r.vt_defined, r.vt_enabled, r.voltage_source, r.voltage_confidence
-ORDER BY r.bay_identifier;
+WITH DATA;
+
+-- Índice único exigido por REFRESH MATERIALIZED VIEW CONCURRENTLY
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_relays_complete_relay
+    ON protec_ai.mv_relays_complete(relay_id);
+
+CREATE OR REPLACE VIEW protec_ai.vw_relays_complete AS
+SELECT * FROM protec_ai.mv_relays_complete
+ORDER BY bay_identifier;
 
 -- REL07: Relés por Subestação
 CREATE OR REPLACE VIEW protec_ai.vw_relays_by_substation AS
@@ -250,7 +263,9 @@ GROUP BY r.voltage_class_kv
 ORDER BY r.voltage_class_kv DESC NULLS LAST;
 
 -- REL09: Parâmetros Críticos Consolidados
-CREATE OR REPLACE VIEW protec_ai.vw_critical_parameters_consolidated AS
+-- Materializada: STRING_AGG sobre todos os parâmetros é a consulta mais cara
+DROP MATERIALIZED VIEW IF EXISTS protec_ai.mv_critical_parameters_consolidated CASCADE;
+CREATE MATERIALIZED VIEW protec_ai.mv_critical_parameters_consolidated AS
 SELECT 
     r.bay_identifier as barra,
     CASE 
@@ -291,6 +306,15 @@ JOIN protec_ai.protection_functions pf ON r.id = pf.relay_id
 JOIN protec_ai.ansi_functions af ON pf.ansi_function_id = af.id
 JOIN protec_ai.parameters p ON pf.id = p.protection_function_id
 WHERE af.ansi_code != 'Unknown'
-GROUP BY barra, m.name, rm.model_name, codigo_ansi, nome_funcao
+-- Agrupa pelas mesmas expressões do índice único: nomes mapeados para a
+-- mesma sigla formam um único grupo (REFRESH CONCURRENTLY exige chave única)
+GROUP BY barra, fabricante, modelo, codigo_ansi, nome_funcao
 HAVING COUNT(DISTINCT CASE WHEN p.parameter_type IN ('Current', 'Voltage', 'Time') THEN p.id END) > 0
+WITH DATA;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_critical_params_key
+    ON protec_ai.mv_critical_parameters_consolidated(barra, fabricante, modelo, codigo_ansi, nome_funcao);
+
+CREATE OR REPLACE VIEW protec_ai.vw_critical_parameters_consolidated AS
+SELECT * FROM protec_ai.mv_critical_parameters_consolidated
 ORDER BY barra, codigo_ansi;
@@ -0,0 +1,224 @@
+-- ProtecAI Database Schema - Stats Cache
+-- Schema: protec_ai
+-- Aggregates read by DatabaseStats (manufacturer / relay type / voltage class),
+-- kept up to date incrementally by triggers on relays, relay_models and manufacturers
+
+SET search_path TO protec_ai;
+
+-- Functions pin their own search_path: triggers also fire from sessions with
+-- the default one (DatabaseLoader writes to protec_ai.* qualified tables)
+
+-- =============================================================================
+-- CACHE TABLES
+-- =============================================================================
+
+CREATE TABLE IF NOT EXISTS stats_cache_manufacturer (
+    manufacturer_id INTEGER PRIMARY KEY REFERENCES manufacturers(id) ON DELETE CASCADE,
+    name VARCHAR(100) NOT NULL,
+    total_relays INTEGER NOT NULL DEFAULT 0,
+    total_models INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS stats_cache_relay_type (
+    relay_type VARCHAR(100) PRIMARY KEY,
+    total INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS stats_cache_voltage_class (
+    voltage_class_kv DECIMAL(10, 2) PRIMARY KEY,
+    total INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+COMMENT ON TABLE stats_cache_manufacturer IS 'Cache de estatísticas: relés e modelos por fabricante';
+COMMENT ON TABLE stats_cache_relay_type IS 'Cache de estatísticas: relés por tipo';
+COMMENT ON TABLE stats_cache_voltage_class IS 'Cache de estatísticas: relés por classe de tensão';
+
+-- Indexes for the ORDER BY used by the summaries
+CREATE INDEX IF NOT EXISTS idx_stats_cache_manufacturer_total ON stats_cache_manufacturer(total_relays DESC);
+CREATE INDEX IF NOT EXISTS idx_stats_cache_relay_type_total ON stats_cache_relay_type(total DESC);
+
+-- =============================================================================
+-- FULL REBUILD (initial load and TRUNCATE)
+-- =============================================================================
+
+CREATE OR REPLACE FUNCTION refresh_stats_cache() RETURNS VOID AS $$
+BEGIN
+    DELETE FROM stats_cache_manufacturer;
+    INSERT INTO stats_cache_manufacturer (manufacturer_id, name, total_relays, total_models)
+    SELECT
+        m.id,
+        m.name,
+        COUNT(DISTINCT r.id),
+        COUNT(DISTINCT rm.id)
+    FROM manufacturers m
+    LEFT JOIN relay_models rm ON m.id = rm.manufacturer_id
+    LEFT JOIN relays r ON rm.id = r.relay_model_id
+    GROUP BY m.id, m.name;
+
+    DELETE FROM stats_cache_relay_type;
+    INSERT INTO stats_cache_relay_type (relay_type, total)
+    SELECT relay_type, COUNT(*)
+    FROM relays
+    WHERE relay_type IS NOT NULL
+    GROUP BY relay_type;
+
+    DELETE FROM stats_cache_voltage_class;
+    INSERT INTO stats_cache_voltage_class (voltage_class_kv, total)
+    SELECT voltage_class_kv, COUNT(*)
+    FROM relays
+    WHERE voltage_class_kv IS NOT NULL
+    GROUP BY voltage_class_kv;
+END;
+$$ LANGUAGE plpgsql
+SET search_path = protec_ai, pg_temp;
+
+-- =============================================================================
+-- INCREMENTAL UPDATES
+-- =============================================================================
+
+CREATE OR REPLACE FUNCTION stats_cache_bump_manufacturer(
+    p_manufacturer_id INTEGER, p_relays INTEGER, p_models INTEGER
+) RETURNS VOID AS $$
+BEGIN
+    IF p_manufacturer_id IS NULL THEN
+        RETURN;
+    END IF;
+    UPDATE stats_cache_manufacturer
+       SET total_relays = total_relays + p_relays,
+           total_models = total_models + p_models,
+           updated_at = CURRENT_TIMESTAMP
+     WHERE manufacturer_id = p_manufacturer_id;
+END;
+$$ LANGUAGE plpgsql
+SET search_path = protec_ai, pg_temp;
+
+CREATE OR REPLACE FUNCTION stats_cache_bump_relay_type(p_relay_type VARCHAR, p_delta INTEGER) RETURNS VOID AS $$
+BEGIN
+    IF p_relay_type IS NULL THEN
+        RETURN;
+    END IF;
+    INSERT INTO stats_cache_relay_type AS c (relay_type, total)
+    VALUES (p_relay_type, p_delta)
+    ON CONFLICT (relay_type) DO UPDATE
+        SET total = c.total + EXCLUDED.total,
+            updated_at = CURRENT_TIMESTAMP;
+    -- Same semantics as GROUP BY: no row for types without relays
+    DELETE FROM stats_cache_relay_type WHERE relay_type = p_relay_type AND total <= 0;
+END;
+$$ LANGUAGE plpgsql
+SET search_path = protec_ai, pg_temp;
+
+CREATE OR REPLACE FUNCTION stats_cache_bump_voltage_class(p_voltage_class_kv DECIMAL, p_delta INTEGER) RETURNS VOID AS $$
+BEGIN
+    IF p_voltage_class_kv IS NULL THEN
+        RETURN;
+    END IF;
+    INSERT INTO stats_cache_voltage_class AS c (voltage_class_kv, total)
+    VALUES (p_voltage_class_kv, p_delta)
+    ON CONFLICT (voltage_class_kv) DO UPDATE
+        SET total = c.total + EXCLUDED.total,
+            updated_at = CURRENT_TIMESTAMP;
+    DELETE FROM stats_cache_voltage_class WHERE voltage_class_kv = p_voltage_class_kv AND total <= 0;
+END;
+$$ LANGUAGE plpgsql
+SET search_path = protec_ai, pg_temp;
+
+-- Trigger: relays (INSERT / DELETE / UPDATE of the grouped columns)
+CREATE OR REPLACE FUNCTION trg_stats_cache_relays() RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM stats_cache_bump_manufacturer(
+            (SELECT manufacturer_id FROM relay_models WHERE id = OLD.relay_model_id), -1, 0
+        );
+        PERFORM stats_cache_bump_relay_type(OLD.relay_type, -1);
+        PERFORM stats_cache_bump_voltage_class(OLD.voltage_class_kv, -1);
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM stats_cache_bump_manufacturer(
+            (SELECT manufacturer_id FROM relay_models WHERE id = NEW.relay_model_id), 1, 0
+        );
+        PERFORM stats_cache_bump_relay_type(NEW.relay_type, 1);
+        PERFORM stats_cache_bump_voltage_class(NEW.voltage_class_kv, 1);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+SET search_path = protec_ai, pg_temp;
+
+CREATE OR REPLACE TRIGGER trg_stats_cache_relays_ins_del
+    AFTER INSERT OR DELETE ON relays
+    FOR EACH ROW EXECUTE FUNCTION trg_stats_cache_relays();
+
+CREATE OR REPLACE TRIGGER trg_stats_cache_relays_upd
+    AFTER UPDATE OF relay_model_id, relay_type, voltage_class_kv ON relays
+    FOR EACH ROW EXECUTE FUNCTION trg_stats_cache_relays();
+
+-- Trigger: relay_models (model count; moving a model moves its relays too)
+CREATE OR REPLACE FUNCTION trg_stats_cache_relay_models() RETURNS TRIGGER AS $$
+DECLARE
+    v_relays INTEGER := 0;
+BEGIN
+    IF TG_OP = 'UPDATE' THEN
+        SELECT COUNT(*) INTO v_relays FROM relays WHERE relay_model_id = NEW.id;
+    END IF;
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM stats_cache_bump_manufacturer(OLD.manufacturer_id, -v_relays, -1);
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM stats_cache_bump_manufacturer(NEW.manufacturer_id, v_relays, 1);
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+SET search_path = protec_ai, pg_temp;
+
+CREATE OR REPLACE TRIGGER trg_stats_cache_relay_models_ins_del
+    AFTER INSERT OR DELETE ON relay_models
+    FOR EACH ROW EXECUTE FUNCTION trg_stats_cache_relay_models();
+
+CREATE OR REPLACE TRIGGER trg_stats_cache_relay_models_upd
+    AFTER UPDATE OF manufacturer_id ON relay_models
+    FOR EACH ROW EXECUTE FUNCTION trg_stats_cache_relay_models();
+
+-- Trigger: manufacturers (new rows start at zero; renames follow)
+CREATE OR REPLACE FUNCTION trg_stats_cache_manufacturers() RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO stats_cache_manufacturer (manufacturer_id, name)
+    VALUES (NEW.id, NEW.name)
+    ON CONFLICT (manufacturer_id) DO UPDATE
+        SET name = EXCLUDED.name,
+            updated_at = CURRENT_TIMESTAMP;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+SET search_path = protec_ai, pg_temp;
+
+CREATE OR REPLACE TRIGGER trg_stats_cache_manufacturers
+    AFTER INSERT OR UPDATE OF name ON manufacturers
+    FOR EACH ROW EXECUTE FUNCTION trg_stats_cache_manufacturers();
+
+-- TRUNCATE skips row triggers: rebuild everything
+CREATE OR REPLACE FUNCTION trg_stats_cache_truncate() RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM refresh_stats_cache();
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+SET search_path = protec_ai, pg_temp;
+
+CREATE OR REPLACE TRIGGER trg_stats_cache_relays_truncate
+    AFTER TRUNCATE ON relays
+    FOR EACH STATEMENT EXECUTE FUNCTION trg_stats_cache_truncate();
+
+CREATE OR REPLACE TRIGGER trg_stats_cache_relay_models_truncate
+    AFTER TRUNCATE ON relay_models
+    FOR EACH STATEMENT EXECUTE FUNCTION trg_stats_cache_truncate();
+
+-- =============================================================================
+-- INITIAL LOAD
+-- =============================================================================
+
+SELECT refresh_stats_cache();
@@ -213,7 +213,8 @@ class ProtecAICLI:
                 self.console.print(f"\n[green]✓ Pipeline executado com sucesso![/green]")
                 self.console.print(f"[green]✓ {summary['unprocessed_count']} arquivo(s) processado(s)[/green]")
                 
-                # Atualizar estatísticas
+                # Atualizar estatísticas (descartando as memoizadas antes da carga)
+                self.db_stats.invalidate()
                 self.print_status_bar()
                 
             except Exception as e:
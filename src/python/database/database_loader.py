@@ -7,10 +7,12 @@ from psycopg2 import sql
 from psycopg2.extras import execute_values
 import pandas as pd
 from pathlib import Path
-from typing import Optional, Dict, List, Tuple
+from typing import Optional, Dict, List, Tuple, Iterable, Sequence
 from datetime import datetime
 import hashlib
 import logging
+import csv
+import io
 import numpy as np
 
 
@@ -26,6 +28,18 @@ def safe_value(val):
 class DatabaseLoader:
     """Carrega dados normalizados do CSV para o PostgreSQL"""
     
+    # Linhas por COPY FROM STDIN (tabelas sem RETURNING: TCs, TPs e parâmetros)
+    COPY_BATCH_SIZE = 10_000
+    
+    # Views materializadas dos relatórios pesados (REL06/REL08 e REL09), ver create_views.sql
+    MATERIALIZED_VIEWS = (
+        'mv_relays_complete',
+        'mv_critical_parameters_consolidated',
+    )
+    
+    # Tabelas cujas estimativas (pg_class.reltuples) alimentam os totais do CLI, ver database_stats.py
+    ANALYZE_TABLES = ('relays', 'protection_functions', 'parameters')
+    
     def __init__(
         self,
         db_host: str = 'localhost',
@@ -76,12 +90,140 @@ class DatabaseLoader:
         """Cria conexão com o banco"""
         return psycopg2.connect(**self.db_config)
     
+    def copy_rows(self, conn, table: str, columns: Sequence[str], rows: Iterable[tuple]) -> int:
+        """
+        Insere linhas em lote via COPY FROM STDIN (formato CSV)
+        
+        Substitui um INSERT por linha: cada lote de COPY_BATCH_SIZE linhas
+        é enviado ao servidor em uma única operação.
+        
+        Args:
+            conn: Conexão com banco
+            table: Nome da tabela (dentro do schema)
+            columns: Colunas na ordem dos valores de cada linha
+            rows: Tuplas de valores (None vira NULL)
+        
+        Returns:
+            Número de linhas inseridas
+        """
+        copy_sql = sql.SQL("COPY {}.{} ({}) FROM STDIN WITH (FORMAT CSV)").format(
+            sql.Identifier(self.schema),
+            sql.Identifier(table),
+            sql.SQL(', ').join(map(sql.Identifier, columns))
+        )
+        
+        count = 0
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        
+        with conn.cursor() as cur:
+            def flush():
+                buffer.seek(0)
+                cur.copy_expert(copy_sql, buffer)
+                buffer.seek(0)
+                buffer.truncate()
+            
+            for row in rows:
+                writer.writerow(row)
+                count += 1
+                if count % self.COPY_BATCH_SIZE == 0:
+                    flush()
+            
+            if buffer.tell():
+                flush()
+        
+        return count
+    
+    def analyze_tables(self, conn) -> List[str]:
+        """
+        Atualiza as estatísticas do planner das tabelas carregadas
+        
+        Os totais do CLI (DatabaseStats.get_total_*) usam a estimativa
+        pg_class.reltuples, que só acompanha a carga após um ANALYZE.
+        Executado em autocommit, após o commit da carga.
+        
+        Args:
+            conn: Conexão com banco
+        
+        Returns:
+            Lista de avisos (vazia se todas as tabelas foram analisadas)
+        """
+        warnings = []
+        conn.autocommit = True
+        
+        with conn.cursor() as cur:
+            for table in self.ANALYZE_TABLES:
+                try:
+                    cur.execute(
+                        sql.SQL("ANALYZE {}.{}").format(
+                            sql.Identifier(self.schema),
+                            sql.Identifier(table)
+                        )
+                    )
+                except psycopg2.Error as e:
+                    warning_msg = f"Falha ao analisar {self.schema}.{table}: {str(e).strip()}"
+                    warnings.append(warning_msg)
+                    self.logger.warning(f"  ⚠️  {warning_msg}")
+        
+        return warnings
+    
+    def refresh_materialized_views(self, conn) -> List[str]:
+        """
+        Atualiza as views materializadas dos relatórios após a carga
+        
+        Usa REFRESH ... CONCURRENTLY para não bloquear leituras de relatórios
+        em andamento (exige índice único em cada view materializada).
+        Executado em autocommit, após o commit da carga; views ausentes
+        (create_views.sql não aplicado) são ignoradas com aviso.
+        
+        Args:
+            conn: Conexão com banco
+        
+        Returns:
+            Lista de avisos (vazia se todas as views foram atualizadas)
+        """
+        warnings = []
+        conn.autocommit = True
+        
+        with conn.cursor() as cur:
+            for view_name in self.MATERIALIZED_VIEWS:
+                try:
+                    cur.execute(
+                        "SELECT to_regclass(format('%%I.%%I', %s::text, %s::text)) IS NULL",
+                        (self.schema, view_name)
+                    )
+                    if cur.fetchone()[0]:
+                        warning_msg = f"{self.schema}.{view_name} não existe (aplicar create_views.sql)"
+                        warnings.append(warning_msg)
+                        self.logger.warning(f"  ⚠️  {warning_msg}")
+                        continue
+                    
+                    cur.execute(
+                        sql.SQL("REFRESH MATERIALIZED VIEW CONCURRENTLY {}.{}").format(
+                            sql.Identifier(self.schema),
+                            sql.Identifier(view_name)
+                        )
+                    )
+                    self.logger.info(f"  ✅ {self.schema}.{view_name} atualizada")
+                except psycopg2.Error as e:
+                    warning_msg = f"Falha ao atualizar {self.schema}.{view_name}: {str(e).strip()}"
+                    warnings.append(warning_msg)
+                    self.logger.warning(f"  ⚠️  {warning_msg}")
+        
+        return warnings
+    
     def calculate_file_hash(self, file_path: Path) -> str:
         """Calcula hash SHA256 do arquivo"""
-        sha256 = hashlib.sha256()
         with open(file_path, 'rb') as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                sha256.update(chunk)
+            if hasattr(hashlib, 'file_digest'):
+                # Python 3.11+: laço de leitura em C
+                return hashlib.file_digest(f, 'sha256').hexdigest()
+            
+            sha256 = hashlib.sha256()
+            buf = bytearray(1 << 20)
+            view = memoryview(buf)
+            while n := f.readinto(buf):
+                sha256.update(view[:n])
         return sha256.hexdigest()
     
     def is_file_processed(self, conn, file_path: Path) -> bool:
@@ -282,39 +424,36 @@ class DatabaseLoader:
         self.logger.info(f"Carregando ct_info de {csv_path.name}")
         
         df = pd.read_csv(csv_path, sep=';')
-        count = 0
+        rows = []
         
-        with conn.cursor() as cur:
-            for _, row in df.iterrows():
-                relay_id_db = relay_map.get(row['relay_id'])
-                if not relay_id_db:
-                    self.logger.warning(f"  ⚠️  Relay {row['relay_id']} não encontrado para CT")
-                    continue
-                
-                # Validar campos obrigatórios (NOT NULL no banco)
-                primary_a = safe_value(row.get('primary_a'))
-                secondary_a = safe_value(row.get('secondary_a'))
-                
-                if primary_a is None or secondary_a is None:
-                    self.logger.warning(f"  ⚠️  CT {row.get('ct_id')} sem dados obrigatórios - pulando")
-                    continue
-                
-                cur.execute(
-                    sql.SQL("""
-                        INSERT INTO {}.current_transformers (
-                            relay_id, tc_type, primary_rating_a, secondary_rating_a, ratio
-                        )
-                        VALUES (%s, %s, %s, %s, %s)
-                    """).format(sql.Identifier(self.schema)),
-                    (
-                        relay_id_db,
-                        safe_value(row.get('ct_type')) or 'TC',
-                        primary_a,
-                        secondary_a,
-                        safe_value(row.get('ratio'))
-                    )
-                )
-                count += 1
+        for _, row in df.iterrows():
+            relay_id_db = relay_map.get(row['relay_id'])
+            if not relay_id_db:
+                self.logger.warning(f"  ⚠️  Relay {row['relay_id']} não encontrado para CT")
+                continue
+            
+            # Validar campos obrigatórios (NOT NULL no banco)
+            primary_a = safe_value(row.get('primary_a'))
+            secondary_a = safe_value(row.get('secondary_a'))
+            
+            if primary_a is None or secondary_a is None:
+                self.logger.warning(f"  ⚠️  CT {row.get('ct_id')} sem dados obrigatórios - pulando")
+                continue
+            
+            rows.append((
+                relay_id_db,
+                safe_value(row.get('ct_type')) or 'TC',
+                primary_a,
+                secondary_a,
+                safe_value(row.get('ratio'))
+            ))
+        
+        count = self.copy_rows(
+            conn,
+            'current_transformers',
+            ('relay_id', 'tc_type', 'primary_rating_a', 'secondary_rating_a', 'ratio'),
+            rows
+        )
         
         self.logger.info(f"  ✅ {count} TCs carregados")
     
@@ -323,40 +462,37 @@ class DatabaseLoader:
         self.logger.info(f"Carregando vt_info de {csv_path.name}")
         
         df = pd.read_csv(csv_path, sep=';')
-        count = 0
+        rows = []
         
-        with conn.cursor() as cur:
-            for _, row in df.iterrows():
-                relay_id_db = relay_map.get(row['relay_id'])
-                if not relay_id_db:
-                    self.logger.warning(f"  ⚠️  Relay {row['relay_id']} não encontrado para VT")
-                    continue
-                
-                # Validar campos obrigatórios
-                primary_v = safe_value(row.get('primary_v'))
-                secondary_v = safe_value(row.get('secondary_v'))
-                
-                if primary_v is None or secondary_v is None:
-                    self.logger.warning(f"  ⚠️  VT {row.get('vt_id')} sem dados obrigatórios - pulando")
-                    continue
-                
-                cur.execute(
-                    sql.SQL("""
-                        INSERT INTO {}.voltage_transformers (
-                            relay_id, vt_type, primary_rating_v, secondary_rating_v, ratio, vt_enabled
-                        )
-                        VALUES (%s, %s, %s, %s, %s, %s)
-                    """).format(sql.Identifier(self.schema)),
-                    (
-                        relay_id_db,
-                        safe_value(row.get('vt_type')) or 'TP',
-                        primary_v,
-                        secondary_v,
-                        safe_value(row.get('ratio')),
-                        True
-                    )
-                )
-                count += 1
+        for _, row in df.iterrows():
+            relay_id_db = relay_map.get(row['relay_id'])
+            if not relay_id_db:
+                self.logger.warning(f"  ⚠️  Relay {row['relay_id']} não encontrado para VT")
+                continue
+            
+            # Validar campos obrigatórios
+            primary_v = safe_value(row.get('primary_v'))
+            secondary_v = safe_value(row.get('secondary_v'))
+            
+            if primary_v is None or secondary_v is None:
+                self.logger.warning(f"  ⚠️  VT {row.get('vt_id')} sem dados obrigatórios - pulando")
+                continue
+            
+            rows.append((
+                relay_id_db,
+                safe_value(row.get('vt_type')) or 'TP',
+                primary_v,
+                secondary_v,
+                safe_value(row.get('ratio')),
+                True
+            ))
+        
+        count = self.copy_rows(
+            conn,
+            'voltage_transformers',
+            ('relay_id', 'vt_type', 'primary_rating_v', 'secondary_rating_v', 'ratio', 'vt_enabled'),
+            rows
+        )
         
         self.logger.info(f"  ✅ {count} VTs carregados")
     
@@ -436,71 +572,70 @@ class DatabaseLoader:
         
         # 2. Carregar CSV e inserir parâmetros
         df = pd.read_csv(csv_path, sep=';')
-        count = 0
+        rows = []
         skipped = 0
         
-        with conn.cursor() as cur:
-            for _, row in df.iterrows():
-                # Mapear relay_id do CSV (R001) -> relay_id banco (1)
-                relay_id_csv = row.get('relay_id')
-                relay_id_db = relay_map.get(relay_id_csv)
-                
-                if not relay_id_db:
-                    self.logger.warning(f"  ⚠️  Relay {relay_id_csv} não encontrado - parâmetro ignorado")
-                    skipped += 1
-                    continue
-                
-                # Obter protection_function_id desse relay
-                prot_func_id = relay_to_prot.get(relay_id_db)
-                if not prot_func_id:
-                    self.logger.warning(f"  ⚠️  Relay {relay_id_csv} sem proteções - parâmetro ignorado")
-                    skipped += 1
-                    continue
-                
-                # Extract values with null handling
-                section_or_code = safe_value(row.get('section_or_code'))
-                parameter_name = safe_value(row.get('parameter_name'))
-                value = safe_value(row.get('value'))
-                
-                # Tentar determinar tipo e unidade (simplificado)
-                parameter_type = 'Configuration'
-                parameter_unit = None
-                
-                # Detect units in value (e.g., "13.80 kV", "150.0 A")
-                if value and isinstance(value, str):
-                    if 'kV' in value or 'V' in value:
-                        parameter_unit = 'V'
-                        parameter_type = 'Voltage'
-                    elif ' A' in value or value.endswith('A'):
-                        parameter_unit = 'A'
-                        parameter_type = 'Current'
-                    elif 's' in value.lower() or 'ms' in value.lower():
-                        parameter_unit = 's'
-                        parameter_type = 'Time'
-                
-                # Insert parameter (schema: protection_function_id, parameter_code, parameter_name, parameter_value, parameter_unit, parameter_type)
-                cur.execute(
-                    sql.SQL("""
-                        INSERT INTO {}.parameters (
-                            protection_function_id,
-                            parameter_code,
-                            parameter_name,
-                            parameter_value,
-                            parameter_unit,
-                            parameter_type
-                        )
-                        VALUES (%s, %s, %s, %s, %s, %s)
-                    """).format(sql.Identifier(self.schema)),
-                    (
-                        prot_func_id,
-                        section_or_code if section_or_code else 'N/A',
-                        parameter_name if parameter_name else 'N/A',
-                        value if value else 'N/A',
-                        parameter_unit,
-                        parameter_type
-                    )
-                )
-                count += 1
+        for _, row in df.iterrows():
+            # Mapear relay_id do CSV (R001) -> relay_id banco (1)
+            relay_id_csv = row.get('relay_id')
+            relay_id_db = relay_map.get(relay_id_csv)
+            
+            if not relay_id_db:
+                self.logger.warning(f"  ⚠️  Relay {relay_id_csv} não encontrado - parâmetro ignorado")
+                skipped += 1
+                continue
+            
+            # Obter protection_function_id desse relay
+            prot_func_id = relay_to_prot.get(relay_id_db)
+            if not prot_func_id:
+                self.logger.warning(f"  ⚠️  Relay {relay_id_csv} sem proteções - parâmetro ignorado")
+                skipped += 1
+                continue
+            
+            # Extract values with null handling
+            section_or_code = safe_value(row.get('section_or_code'))
+            parameter_name = safe_value(row.get('parameter_name'))
+            value = safe_value(row.get('value'))
+            
+            # Tentar determinar tipo e unidade (simplificado)
+            parameter_type = 'Configuration'
+            parameter_unit = None
+            
+            # Detect units in value (e.g., "13.80 kV", "150.0 A")
+            if value and isinstance(value, str):
+                if 'kV' in value or 'V' in value:
+                    parameter_unit = 'V'
+                    parameter_type = 'Voltage'
+                elif ' A' in value or value.endswith('A'):
+                    parameter_unit = 'A'
+                    parameter_type = 'Current'
+                elif 's' in value.lower() or 'ms' in value.lower():
+                    parameter_unit = 's'
+                    parameter_type = 'Time'
+            
+            rows.append((
+                prot_func_id,
+                section_or_code if section_or_code else 'N/A',
+                parameter_name if parameter_name else 'N/A',
+                value if value else 'N/A',
+                parameter_unit,
+                parameter_type
+            ))
+        
+        # Inserção em lote (schema: protection_function_id, parameter_code, parameter_name, parameter_value, parameter_unit, parameter_type)
+        count = self.copy_rows(
+            conn,
+            'parameters',
+            (
+                'protection_function_id',
+                'parameter_code',
+                'parameter_name',
+                'parameter_value',
+                'parameter_unit',
+                'parameter_type'
+            ),
+            rows
+        )
         
         self.logger.info(f"  ✅ {count} parâmetros carregados")
         if skipped > 0:
@@ -523,7 +658,8 @@ class DatabaseLoader:
             'vts': 0,
             'protections': 0,
             'parameters': 0,
-            'errors': []
+            'errors': [],
+            'warnings': []
         }
         
         # Arquivos esperados (nomes atualizados do normalizador)
@@ -576,6 +712,11 @@ class DatabaseLoader:
             # Commit
             conn.commit()
             
+            # Estatísticas e views materializadas refletem a carga recém-confirmada
+            # (dados já confirmados: falhas aqui são avisos, não erros da carga)
+            stats['warnings'].extend(self.analyze_tables(conn))
+            stats['warnings'].extend(self.refresh_materialized_views(conn))
+            
             self.logger.info("=" * 80)
             self.logger.info(f"✅ CONCLUÍDO: {stats['relays']} relés carregados com sucesso")
             self.logger.info("=" * 80)
@@ -23,6 +23,13 @@ class ExcelExporter:
     - UTF-8 support
     """
     
+    # Workbooks are streamed row by row (rows must be written top to bottom)
+    WORKBOOK_OPTIONS = {
+        'constant_memory': True,
+        'use_zip64': True,
+        'strings_to_urls': False,
+    }
+    
     def __init__(self, output_dir: str, logger=None):
         """
         Initialize Excel exporter
@@ -35,14 +42,14 @@ class ExcelExporter:
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.logger = logger
         
-        # Check if openpyxl is available
+        # Check if xlsxwriter is available
         try:
-            import openpyxl
-            self.openpyxl = openpyxl
+            import xlsxwriter
+            self.xlsxwriter = xlsxwriter
             self.available = True
         except ImportError:
-            self._log_error("openpyxl not installed. Excel export will not be available.")
-            self._log_error("Install with: pip install openpyxl")
+            self._log_error("xlsxwriter not installed. Excel export will not be available.")
+            self._log_error("Install with: pip install xlsxwriter")
             self.available = False
     
     def export_relay_data(self, parsed_data: Dict[str, Any], base_filename: str) -> Optional[str]:
@@ -57,7 +64,7 @@ class ExcelExporter:
             Path to created Excel file or None if export fails
         """
         if not self.available:
-            self._log_error("Excel export not available (openpyxl missing)")
+            self._log_error("Excel export not available (xlsxwriter missing)")
             return None
         
         self._log_info(f"Starting Excel export for: {base_filename}")
@@ -67,30 +74,28 @@ class ExcelExporter:
         temp_filepath = filepath.with_suffix('.xlsx.tmp')
         
         try:
-            # Create workbook
-            wb = self.openpyxl.Workbook()
-            
-            # Remove default sheet
-            if 'Sheet' in wb.sheetnames:
-                wb.remove(wb['Sheet'])
-            
-            # Create sheets
-            self._create_relay_summary_sheet(wb, parsed_data)
-            
-            if parsed_data.get('ct_data'):
-                self._create_ct_sheet(wb, parsed_data['ct_data'], parsed_data['relay_data']['barras_identificador'])
-            
-            if parsed_data.get('vt_data'):
-                self._create_vt_sheet(wb, parsed_data['vt_data'], parsed_data['relay_data']['barras_identificador'])
-            
-            if parsed_data.get('protection_functions'):
-                self._create_protection_functions_sheet(wb, parsed_data['protection_functions'], parsed_data['relay_data']['barras_identificador'])
+            # Create workbook (streamed to the temporary file)
+            wb = self.xlsxwriter.Workbook(str(temp_filepath), self.WORKBOOK_OPTIONS)
+            formats = self._create_formats(wb)
             
-            # Create metadata sheet
-            self._create_metadata_sheet(wb, parsed_data)
-            
-            # Save to temporary file first
-            wb.save(temp_filepath)
+            try:
+                # Create sheets
+                self._create_relay_summary_sheet(wb, formats, parsed_data)
+                
+                if parsed_data.get('ct_data'):
+                    self._create_ct_sheet(wb, formats, parsed_data['ct_data'], parsed_data['relay_data']['barras_identificador'])
+                
+                if parsed_data.get('vt_data'):
+                    self._create_vt_sheet(wb, formats, parsed_data['vt_data'], parsed_data['relay_data']['barras_identificador'])
+                
+                if parsed_data.get('protection_functions'):
+                    self._create_protection_functions_sheet(wb, formats, parsed_data['protection_functions'], parsed_data['relay_data']['barras_identificador'])
+                
+                # Create metadata sheet
+                self._create_metadata_sheet(wb, formats, parsed_data)
+            finally:
+                # Save to temporary file first
+                wb.close()
             
             # Rename to final file (atomic operation)
             temp_filepath.rename(filepath)
@@ -105,9 +110,53 @@ class ExcelExporter:
                 temp_filepath.unlink()
             raise
     
-    def _create_relay_summary_sheet(self, wb, parsed_data: Dict[str, Any]) -> None:
+    def _create_formats(self, wb) -> Dict[str, Any]:
+        """Create the cell formats shared by all sheets of a workbook"""
+        return {
+            'header': wb.add_format({
+                'bold': True, 'font_color': '#FFFFFF', 'bg_color': '#366092',
+                'align': 'center', 'valign': 'vcenter'
+            }),
+            'cell': wb.add_format({'align': 'left', 'valign': 'vcenter'}),
+            'cell_0.000': wb.add_format({'align': 'left', 'valign': 'vcenter', 'num_format': '0.000'}),
+            'cell_0.00': wb.add_format({'align': 'left', 'valign': 'vcenter', 'num_format': '0.00'}),
+            'cell_top': wb.add_format({'align': 'left', 'valign': 'top'}),
+            'cell_top_wrap': wb.add_format({'align': 'left', 'valign': 'top', 'text_wrap': True}),
+            'status_enabled': wb.add_format({
+                'align': 'left', 'valign': 'top', 'bold': True,
+                'font_color': '#006100', 'bg_color': '#C6EFCE'
+            }),
+            'meta_key': wb.add_format({'bold': True}),
+            'meta_section': wb.add_format({'bold': True, 'font_size': 12, 'bg_color': '#D9D9D9'}),
+        }
+    
+    def _write_table(self, ws, formats: Dict[str, Any], headers: List[str], rows: List[List[Any]],
+                     cell_formats: List[Any]) -> None:
+        """
+        Write header + data rows in order, then size columns from the written values
+        
+        cell_formats holds one format per column for the data rows.
+        """
+        widths = [len(header) for header in headers]
+        
+        ws.write_row(0, 0, headers, formats['header'])
+        
+        for row_idx, row_data in enumerate(rows, start=1):
+            for col, value in enumerate(row_data):
+                ws.write(row_idx, col, value, cell_formats[col])
+                if value and len(str(value)) > widths[col]:
+                    widths[col] = len(str(value))
+        
+        # Auto-size columns (capped at 50)
+        for col, width in enumerate(widths):
+            ws.set_column(col, col, min(width + 2, 50))
+        
+        # Freeze first row
+        ws.freeze_panes(1, 0)
+    
+    def _create_relay_summary_sheet(self, wb, formats: Dict[str, Any], parsed_data: Dict[str, Any]) -> None:
         """Create relay summary sheet"""
-        ws = wb.create_sheet("Relay Summary", 0)
+        ws = wb.add_worksheet("Relay Summary")
         relay_data = parsed_data['relay_data']
         manufacturer = parsed_data['manufacturer']
         
@@ -128,15 +177,7 @@ class ExcelExporter:
             'Export Timestamp'
         ]
         
-        # Write headers
-        for col, header in enumerate(headers, start=1):
-            cell = ws.cell(row=1, column=col, value=header)
-            cell.font = self.openpyxl.styles.Font(bold=True, size=11)
-            cell.fill = self.openpyxl.styles.PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-            cell.font = self.openpyxl.styles.Font(color="FFFFFF", bold=True)
-            cell.alignment = self.openpyxl.styles.Alignment(horizontal='center', vertical='center')
-        
-        # Write data
+        # Data
         data_row = [
             str(manufacturer),
             str(relay_data.get('modelo_rele', '')),
@@ -153,23 +194,16 @@ class ExcelExporter:
             datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         ]
         
-        for col, value in enumerate(data_row, start=1):
-            cell = ws.cell(row=2, column=col, value=value)
-            cell.alignment = self.openpyxl.styles.Alignment(horizontal='left', vertical='center')
-        
-        # Format numeric columns
-        ws.column_dimensions['I'].number_format = '0.000'  # Voltage
-        ws.column_dimensions['J'].number_format = '0.00'   # Frequency
+        # Numeric columns: Voltage (I) and Frequency (J)
+        cell_formats = [formats['cell']] * len(headers)
+        cell_formats[8] = formats['cell_0.000']
+        cell_formats[9] = formats['cell_0.00']
         
-        # Auto-size columns
-        self._auto_size_columns(ws)
-        
-        # Freeze first row
-        ws.freeze_panes = 'A2'
+        self._write_table(ws, formats, headers, [data_row], cell_formats)
     
-    def _create_ct_sheet(self, wb, ct_data: List[Dict[str, Any]], barras_id: str) -> None:
+    def _create_ct_sheet(self, wb, formats: Dict[str, Any], ct_data: List[Dict[str, Any]], barras_id: str) -> None:
         """Create CT (Current Transformer) sheet"""
-        ws = wb.create_sheet("Current Transformers")
+        ws = wb.add_worksheet("Current Transformers")
         
         # Headers
         headers = [
@@ -181,17 +215,9 @@ class ExcelExporter:
             'Export Timestamp'
         ]
         
-        # Write headers with formatting
-        for col, header in enumerate(headers, start=1):
-            cell = ws.cell(row=1, column=col, value=header)
-            cell.font = self.openpyxl.styles.Font(bold=True, size=11)
-            cell.fill = self.openpyxl.styles.PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-            cell.font = self.openpyxl.styles.Font(color="FFFFFF", bold=True)
-            cell.alignment = self.openpyxl.styles.Alignment(horizontal='center', vertical='center')
-        
-        # Write data
-        for idx, ct in enumerate(ct_data, start=2):
-            row_data = [
+        # Data
+        rows = [
+            [
                 str(barras_id),
                 str(ct.get('tc_type', 'Phase')),
                 self._safe_float(ct.get('primary_rating_a')),
@@ -199,27 +225,21 @@ class ExcelExporter:
                 str(ct.get('ratio', '')),
                 datetime.now().strftime('%Y-%m-%d %H:%M:%S')
             ]
-            
-            for col, value in enumerate(row_data, start=1):
-                cell = ws.cell(row=idx, column=col, value=value)
-                cell.alignment = self.openpyxl.styles.Alignment(horizontal='left', vertical='center')
+            for ct in ct_data
+        ]
         
-        # Format numeric columns
-        ws.column_dimensions['C'].number_format = '0.00'  # Primary
-        ws.column_dimensions['D'].number_format = '0.00'  # Secondary
+        # Numeric columns: Primary (C) and Secondary (D)
+        cell_formats = [formats['cell']] * len(headers)
+        cell_formats[2] = cell_formats[3] = formats['cell_0.00']
         
-        # Auto-size columns
-        self._auto_size_columns(ws)
-        
-        # Freeze first row
-        ws.freeze_panes = 'A2'
+        self._write_table(ws, formats, headers, rows, cell_formats)
         
         # Add auto-filter
-        ws.auto_filter.ref = ws.dimensions
+        ws.autofilter(0, 0, len(rows), len(headers) - 1)
     
-    def _create_vt_sheet(self, wb, vt_data: List[Dict[str, Any]], barras_id: str) -> None:
+    def _create_vt_sheet(self, wb, formats: Dict[str, Any], vt_data: List[Dict[str, Any]], barras_id: str) -> None:
         """Create VT (Voltage Transformer) sheet"""
-        ws = wb.create_sheet("Voltage Transformers")
+        ws = wb.add_worksheet("Voltage Transformers")
         
         # Headers
         headers = [
@@ -231,17 +251,9 @@ class ExcelExporter:
             'Export Timestamp'
         ]
         
-        # Write headers with formatting
-        for col, header in enumerate(headers, start=1):
-            cell = ws.cell(row=1, column=col, value=header)
-            cell.font = self.openpyxl.styles.Font(bold=True, size=11)
-            cell.fill = self.openpyxl.styles.PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-            cell.font = self.openpyxl.styles.Font(color="FFFFFF", bold=True)
-            cell.alignment = self.openpyxl.styles.Alignment(horizontal='center', vertical='center')
-        
-        # Write data
-        for idx, vt in enumerate(vt_data, start=2):
-            row_data = [
+        # Data
+        rows = [
+            [
                 str(barras_id),
                 str(vt.get('vt_type', 'Main')),
                 self._safe_float(vt.get('primary_rating_v')),
@@ -249,27 +261,21 @@ class ExcelExporter:
                 str(vt.get('ratio', '')),
                 datetime.now().strftime('%Y-%m-%d %H:%M:%S')
             ]
-            
-            for col, value in enumerate(row_data, start=1):
-                cell = ws.cell(row=idx, column=col, value=value)
-                cell.alignment = self.openpyxl.styles.Alignment(horizontal='left', vertical='center')
-        
-        # Format numeric columns
-        ws.column_dimensions['C'].number_format = '0.00'  # Primary
-        ws.column_dimensions['D'].number_format = '0.00'  # Secondary
+            for vt in vt_data
+        ]
         
-        # Auto-size columns
-        self._auto_size_columns(ws)
+        # Numeric columns: Primary (C) and Secondary (D)
+        cell_formats = [formats['cell']] * len(headers)
+        cell_formats[2] = cell_formats[3] = formats['cell_0.00']
         
-        # Freeze first row
-        ws.freeze_panes = 'A2'
+        self._write_table(ws, formats, headers, rows, cell_formats)
         
         # Add auto-filter
-        ws.auto_filter.ref = ws.dimensions
+        ws.autofilter(0, 0, len(rows), len(headers) - 1)
     
-    def _create_protection_functions_sheet(self, wb, prot_funcs: List[Dict[str, Any]], barras_id: str) -> None:
+    def _create_protection_functions_sheet(self, wb, formats: Dict[str, Any], prot_funcs: List[Dict[str, Any]], barras_id: str) -> None:
         """Create protection functions sheet"""
-        ws = wb.create_sheet("Protection Functions")
+        ws = wb.add_worksheet("Protection Functions")
         
         # Headers
         headers = [
@@ -282,16 +288,8 @@ class ExcelExporter:
             'Export Timestamp'
         ]
         
-        # Write headers with formatting
-        for col, header in enumerate(headers, start=1):
-            cell = ws.cell(row=1, column=col, value=header)
-            cell.font = self.openpyxl.styles.Font(bold=True, size=11)
-            cell.fill = self.openpyxl.styles.PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-            cell.font = self.openpyxl.styles.Font(color="FFFFFF", bold=True)
-            cell.alignment = self.openpyxl.styles.Alignment(horizontal='center', vertical='center')
-        
-        # Write data (only enabled functions)
-        row_idx = 2
+        # Data (only enabled functions)
+        rows = []
         for func in prot_funcs:
             if not func.get('is_enabled', False):
                 continue
@@ -299,7 +297,7 @@ class ExcelExporter:
             setpoints = func.get('setpoints', {})
             setpoints_json = json.dumps(setpoints, ensure_ascii=False, indent=2) if setpoints else '{}'
             
-            row_data = [
+            rows.append([
                 str(barras_id),
                 str(func.get('ansi_code', '')),
                 str(func.get('section', '')),
@@ -307,33 +305,23 @@ class ExcelExporter:
                 ', '.join(func.get('active_thresholds', [])),
                 setpoints_json,
                 datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            ]
-            
-            for col, value in enumerate(row_data, start=1):
-                cell = ws.cell(row=row_idx, column=col, value=value)
-                cell.alignment = self.openpyxl.styles.Alignment(horizontal='left', vertical='top', wrap_text=(col == 6))
-            
-            # Color-code status
-            status_cell = ws.cell(row=row_idx, column=4)
-            status_cell.fill = self.openpyxl.styles.PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
-            status_cell.font = self.openpyxl.styles.Font(color="006100", bold=True)
-            
-            row_idx += 1
+            ])
         
-        # Auto-size columns
-        self._auto_size_columns(ws)
-        ws.column_dimensions['F'].width = 50  # Wider for JSON
+        # Top-aligned; JSON column wraps; status is color-coded
+        cell_formats = [formats['cell_top']] * len(headers)
+        cell_formats[3] = formats['status_enabled']
+        cell_formats[5] = formats['cell_top_wrap']
         
-        # Freeze first row
-        ws.freeze_panes = 'A2'
+        self._write_table(ws, formats, headers, rows, cell_formats)
+        ws.set_column(5, 5, 50)  # Wider for JSON
         
         # Add auto-filter
-        if row_idx > 2:  # Only if we have data
-            ws.auto_filter.ref = ws.dimensions
+        if rows:  # Only if we have data
+            ws.autofilter(0, 0, len(rows), len(headers) - 1)
     
-    def _create_metadata_sheet(self, wb, parsed_data: Dict[str, Any]) -> None:
+    def _create_metadata_sheet(self, wb, formats: Dict[str, Any], parsed_data: Dict[str, Any]) -> None:
         """Create metadata sheet with export information"""
-        ws = wb.create_sheet("Metadata")
+        ws = wb.add_worksheet("Metadata")
         
         # Metadata
         metadata = [
@@ -357,36 +345,17 @@ class ExcelExporter:
             ['Precision Level', 'HIGH']
         ]
         
-        for row_idx, (key, value) in enumerate(metadata, start=1):
-            cell_key = ws.cell(row=row_idx, column=1, value=key)
-            cell_value = ws.cell(row=row_idx, column=2, value=value)
-            
+        # Column widths
+        ws.set_column(0, 0, 30)
+        ws.set_column(1, 1, 50)
+        
+        for row_idx, (key, value) in enumerate(metadata):
             # Format section headers
             if value == '' and key != '':
-                cell_key.font = self.openpyxl.styles.Font(bold=True, size=12)
-                cell_key.fill = self.openpyxl.styles.PatternFill(start_color="D9D9D9", end_color="D9D9D9", fill_type="solid")
+                ws.write(row_idx, 0, key, formats['meta_section'])
             else:
-                cell_key.font = self.openpyxl.styles.Font(bold=True)
-        
-        # Auto-size columns
-        ws.column_dimensions['A'].width = 30
-        ws.column_dimensions['B'].width = 50
-    
-    def _auto_size_columns(self, ws) -> None:
-        """Auto-size columns based on content"""
-        for column in ws.columns:
-            max_length = 0
-            column_letter = column[0].column_letter
-            
-            for cell in column:
-                try:
-                    if cell.value:
-                        max_length = max(max_length, len(str(cell.value)))
-                except:
-                    pass
-            
-            adjusted_width = min(max_length + 2, 50)  # Cap at 50
-            ws.column_dimensions[column_letter].width = adjusted_width
+                ws.write(row_idx, 0, key, formats['meta_key'])
+            ws.write(row_idx, 1, value)
     
     def _safe_float(self, value: Any) -> Optional[float]:
         """Safely convert value to float"""
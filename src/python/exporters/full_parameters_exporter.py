@@ -94,6 +94,9 @@ class FullParametersExporter:
                 if not all_params:
                     all_params = parsed_data.get('raw_extracted', {}).get('all_parameters', [])
                 
+                # Counted while writing rows (used by the summary and the log)
+                continuation_count = 0
+                
                 if not all_params:
                     writer.writerow(['', 'No parameters extracted', '', '', ''])
                 else:
@@ -103,6 +106,9 @@ class FullParametersExporter:
                         # Handle different parameter formats
                         # PDF format: code, parameter, value
                         # INI format: section, key, value
+                        continuation = param.get('continuation_lines')
+                        if continuation:
+                            continuation_count += 1
                         
                         if 'section' in param:
                             # SEPAM INI format
@@ -115,7 +121,6 @@ class FullParametersExporter:
                             code = param.get('code', '')
                             parameter = param.get('parameter', '')
                             value = param.get('value', '')
-                            continuation = param.get('continuation_lines', [])
                             continuation_str = ' | '.join(continuation) if continuation else ''
                         
                         writer.writerow([
@@ -131,8 +136,7 @@ class FullParametersExporter:
                 writer.writerow([''])
                 writer.writerow(['EXTRACTION SUMMARY'])
                 writer.writerow(['Total Parameters Extracted', len(all_params)])
-                writer.writerow(['Parameters with Continuation', 
-                               sum(1 for p in all_params if p.get('continuation_lines'))])
+                writer.writerow(['Parameters with Continuation', continuation_count])
                 writer.writerow(['Coverage Estimate', 
                                f"{min(100, (len(all_params) / 450) * 100):.1f}%"])
             
@@ -142,7 +146,7 @@ class FullParametersExporter:
             if self.logger:
                 self.logger.info(f"  ✓ Full parameters CSV: {filename}")
                 self.logger.info(f"    - Total parameters: {len(all_params)}")
-                self.logger.info(f"    - With continuation: {sum(1 for p in all_params if p.get('continuation_lines'))}")
+                self.logger.info(f"    - With continuation: {continuation_count}")
             
             return str(filepath)
             
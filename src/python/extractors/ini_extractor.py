@@ -260,13 +260,6 @@ class IniExtractor:
         with open(ini_path, 'r', encoding='utf-8', errors='ignore') as f:
             raw_content = f.read()
         
-        # Also parse with ConfigParser for structured access
-        config = configparser.ConfigParser()
-        try:
-            config.read(ini_path, encoding='utf-8')
-        except UnicodeDecodeError:
-            config.read(ini_path, encoding='latin-1')
-        
         current_section = None
         line_num = 0
         
@@ -316,16 +309,19 @@ class IniExtractor:
         Validate extraction completeness
         Returns validation metrics including completeness score and warnings
         """
-        # Count lines in original file
+        # Read the original file once for both counts
         with open(ini_path, 'r', encoding='utf-8', errors='ignore') as f:
-            total_lines = len(f.readlines())
+            lines = f.readlines()
+        
+        # Count lines in original file
+        total_lines = len(lines)
         
         # Count non-empty, non-comment lines
-        with open(ini_path, 'r', encoding='utf-8', errors='ignore') as f:
-            useful_lines = sum(1 for line in f if line.strip() 
-                             and not line.strip().startswith(';') 
-                             and not line.strip().startswith('#')
-                             and not line.strip().startswith('['))
+        useful_lines = 0
+        for line in lines:
+            stripped = line.strip()
+            if stripped and not stripped.startswith((';', '#', '[')):
+                useful_lines += 1
         
         extracted_count = len(parameters)
         
@@ -3,30 +3,80 @@ PDF Extractor for MICON Relay Files
 Extracts text content from PDF files exported from .set files
 """
 
+import hashlib
+import os
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 import pdfplumber
 
 
+def _read_pdf_text(pdf_path: str) -> str:
+    """Extract all text from PDF with pdfplumber"""
+    text = ""
+    with pdfplumber.open(pdf_path) as pdf:
+        for page in pdf.pages:
+            page_text = page.extract_text()
+            if page_text:
+                text += page_text + "\n"
+    return text
+
+
+@lru_cache(maxsize=64)
+def _extract_text_cached(pdf_path: str, mtime_ns: int, size: int,
+                         cache_dir: Optional[str] = None) -> str:
+    """
+    Extract all text from PDF; keyed on (path, mtime_ns, size) so edits invalidate
+    
+    With cache_dir, the text is also kept on disk under the SHA-256 of the PDF
+    content (plus the pdfplumber version), so it survives across processes.
+    """
+    if cache_dir is None:
+        return _read_pdf_text(pdf_path)
+    
+    digest = hashlib.sha256(Path(pdf_path).read_bytes()).hexdigest()
+    cache_file = Path(cache_dir) / f'{digest}-pdfplumber{pdfplumber.__version__}.txt'
+    try:
+        return cache_file.read_text(encoding='utf-8')
+    except FileNotFoundError:
+        pass
+    
+    text = _read_pdf_text(pdf_path)
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = cache_file.with_suffix('.tmp')
+    tmp_file.write_text(text, encoding='utf-8')
+    os.replace(tmp_file, cache_file)
+    return text
+
+
 class PdfExtractor:
     """Extracts structured data from PDF relay configuration files"""
     
-    def __init__(self):
+    # Parameter line patterns (compiled once, see extract_all_parameters)
+    # Pattern 1: "CODE: Parameter: Value" or "CODE: Parameter ?: Value"
+    # Supports: "0120: ..." (4 digits) and "00.01: ..." (GE format)
+    PARAM_RE_1 = re.compile(r'^(\d{2}\.?\d{2}):\s*(.+?)(?:\s*\?)?:\s*(.+)$')
+    # Pattern 2: "CODE: Parameter = Value" or "CODE: Parameter=Value"
+    PARAM_RE_2 = re.compile(r'^(\d{2}\.?\d{2}):\s*(.+?)\s*=\s*(.+)$')
+    # Pattern 3: "CODE: Parameter" (value on next line or just parameter name)
+    PARAM_RE_3 = re.compile(r'^(\d{2}\.?\d{2}):\s*(.+)$')
+    # Header/footer lines skipped as continuations (matched against line.lower())
+    SKIP_LINE_RE = re.compile(r'easergy studio|settings file|page:|micom')
+    
+    def __init__(self, text_cache_dir: Optional[str] = None):
+        # Optional on-disk text cache directory (None = memory only)
+        self.text_cache_dir = text_cache_dir
         self.manufacturer_signatures = {
             'SCHNEIDER ELECTRIC': ['Easergy Studio'],
             'GENERAL ELECTRIC': ['MiCOM S1 Agile', 'MiCOM Agile']
         }
     
     def extract_text(self, pdf_path: str) -> str:
-        """Extract all text from PDF"""
-        text = ""
-        with pdfplumber.open(pdf_path) as pdf:
-            for page in pdf.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
-        return text
+        """Extract all text from PDF (cached across instances while the file is unchanged)"""
+        st = os.stat(pdf_path)
+        return _extract_text_cached(os.path.abspath(pdf_path), st.st_mtime_ns, st.st_size,
+                                    self.text_cache_dir)
     
     def extract_by_pages(self, pdf_path: str) -> List[str]:
         """Extract text page by page"""
@@ -241,14 +291,11 @@ class PdfExtractor:
         parameters = []
         lines = text.split('\n')
         
-        # Multiple patterns to capture different formats
-        # Pattern 1: "CODE: Parameter: Value" or "CODE: Parameter ?: Value"
-        # Supports: "0120: ..." (4 digits) and "00.01: ..." (GE format)
-        param_pattern1 = re.compile(r'^(\d{2}\.?\d{2}):\s*(.+?)(?:\s*\?)?:\s*(.+)$')
-        # Pattern 2: "CODE: Parameter = Value" or "CODE: Parameter=Value"
-        param_pattern2 = re.compile(r'^(\d{2}\.?\d{2}):\s*(.+?)\s*=\s*(.+)$')
-        # Pattern 3: "CODE: Parameter" (value on next line or just parameter name)
-        param_pattern3 = re.compile(r'^(\d{2}\.?\d{2}):\s*(.+)$')
+        # Multiple patterns to capture different formats (see PARAM_RE_*)
+        param_pattern1 = self.PARAM_RE_1
+        param_pattern2 = self.PARAM_RE_2
+        param_pattern3 = self.PARAM_RE_3
+        skip_line = self.SKIP_LINE_RE.search
         
         current_param = None
         continuation_lines = []
@@ -280,9 +327,8 @@ class PdfExtractor:
                     'continuation_lines': []
                 }
             
-            elif param_pattern3.match(line):
+            elif (match3 := param_pattern3.match(line)):
                 # Pattern 3: code exists but no clear value separator
-                match3 = param_pattern3.match(line)
                 
                 # Save previous parameter if exists
                 if current_param:
@@ -304,8 +350,7 @@ class PdfExtractor:
             elif current_param:
                 # Line without code - treat as continuation of previous parameter
                 # Skip common headers and footers
-                if not any(skip in line.lower() for skip in 
-                          ['easergy studio', 'settings file', 'page:', 'micom']):
+                if not skip_line(line.lower()):
                     continuation_lines.append(line)
         
         # Don't forget last parameter
@@ -28,7 +28,7 @@ import sys
 import os
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, Tuple, Optional
+from typing import Dict, Any, Tuple, Optional, Set
 from dotenv import load_dotenv
 
 project_root = Path(__file__).parent.parent.parent
@@ -36,6 +36,7 @@ sys.path.insert(0, str(project_root))
 
 from src.python.utils.logger import PipelineLogger
 from src.python.utils.file_manager import FileManager
+from src.python.utils.file_scanner import FileScanner
 from src.python.utils.glossary_loader import GlossaryLoader
 from src.python.database.repository import DatabaseRepository
 from src.python.parsers.micon_parser import MiconParser
@@ -65,6 +66,9 @@ class ProtecAIPipeline:
         stats (Dict): Estatísticas de processamento
     """
     
+    # Pending marks are written to the registry every N exported files
+    MARK_BATCH_SIZE = 50
+    
     def __init__(self, config_dir: Optional[str] = None) -> None:
         """Inicializa o pipeline com todos os componentes necessários.
         
@@ -97,6 +101,12 @@ class ProtecAIPipeline:
         self.output_csv_dir = project_root / 'outputs' / 'csv'
         self.output_excel_dir = project_root / 'outputs' / 'excel'
         
+        # PDFs processed by name, for the CLI scan summary (separate from the hash registry)
+        self.file_scanner = FileScanner(
+            pdf_dir=str(self.input_pdf_dir),
+            registry_file=str(project_root / 'inputs' / 'registry' / 'processed_pdfs.json')
+        )
+        
         # Initialize exporters
         self.csv_exporter = FullParametersExporter(
             output_dir=str(self.output_csv_dir),
@@ -117,6 +127,11 @@ class ProtecAIPipeline:
             'exported_excel': 0,
             'export_errors': 0
         }
+        
+        # File path -> registry metadata for files exported and not yet written to the registry
+        self._pending_marks: Dict[str, Dict[str, Any]] = {}
+        # Content hashes of those files, so identical copies later in the run are skipped
+        self._pending_hashes: Set[str] = set()
     
     def run(self):
         """Execute the complete pipeline"""
@@ -138,8 +153,14 @@ class ProtecAIPipeline:
             # Step 2: Process each file
             self.logger.step(2, "Processing files")
             
-            for file_path in all_files:
-                self._process_file(file_path)
+            try:
+                for file_path in all_files:
+                    self._process_file(file_path)
+                    if len(self._pending_marks) >= self.MARK_BATCH_SIZE:
+                        self._flush_pending_marks()
+            finally:
+                # Exported files stay marked even if the loop is interrupted
+                self._flush_pending_marks()
             
             # Step 2.5: Normalize CSV files
             self.logger.info("[STEP 2.5] Normalizing CSV files to 3FN format")
@@ -159,13 +180,27 @@ class ProtecAIPipeline:
             self.logger.error(f"Pipeline failed: {str(e)}", exc_info=True)
             raise
     
+    def _flush_pending_marks(self):
+        """Write the pending marks to the registry in a single batch"""
+        if not self._pending_marks:
+            return
+        self.file_manager.mark_files_processed(
+            list(self._pending_marks), metadata_per=self._pending_marks
+        )
+        self.file_scanner.mark_many_as_processed(
+            [Path(path) for path in self._pending_marks if path.lower().endswith('.pdf')]
+        )
+        self._pending_marks.clear()
+        self._pending_hashes.clear()
+    
     def _process_file(self, file_path: Path):
         """Process a single file"""
         try:
             self.logger.info(f"\nProcessing: {file_path.name}")
             
-            # Check if already processed
-            if self.file_manager.is_file_processed(str(file_path)):
+            # Check if already processed (in the registry or pending in this run)
+            file_hash = self.file_manager.calculate_file_hash(str(file_path))
+            if file_hash in self._pending_hashes or self.file_manager.is_file_processed(str(file_path)):
                 self.logger.info("  ✓ File already processed (skipping)")
                 self.stats['skipped_duplicate'] += 1
                 return
@@ -220,16 +255,14 @@ class ProtecAIPipeline:
                 # Don't mark as processed if export fails
                 return
             
-            # Mark as processed only after successful export
-            self.file_manager.mark_file_processed(
-                str(file_path),
-                metadata={
-                    'manufacturer': parsed_data['manufacturer'],
-                    'model': parsed_data['relay_data']['modelo_rele'],
-                    'exported': True,
-                    'export_timestamp': datetime.now().isoformat()
-                }
-            )
+            # Mark as processed only after successful export (written in batch by run())
+            self._pending_marks[str(file_path)] = {
+                'manufacturer': parsed_data['manufacturer'],
+                'model': parsed_data['relay_data']['modelo_rele'],
+                'exported': True,
+                'export_timestamp': datetime.now().isoformat()
+            }
+            self._pending_hashes.add(file_hash)
             
             self.stats['processed'] += 1
             
@@ -263,7 +296,7 @@ class ProtecAIPipeline:
                     self.stats['exported_excel'] += 1
                     self.logger.info(f"    ✓ Excel export: 1 workbook")
                 else:
-                    self.logger.warning(f"    ⚠ Excel export skipped (openpyxl not available)")
+                    self.logger.warning(f"    ⚠ Excel export skipped (xlsxwriter not available)")
             except Exception as e:
                 self.logger.error(f"    ✗ Excel export failed: {str(e)}")
                 # Don't fail the entire export if only Excel fails
@@ -364,6 +397,8 @@ class ProtecAIPipeline:
             self.logger.info(f"    - Parameters: {stats.get('parameters', 0)}")
             self.logger.info(f"    - CTs: {stats.get('cts', 0)}")
             self.logger.info(f"    - VTs: {stats.get('vts', 0)}")
+            for warning in stats.get('errors', []) + stats.get('warnings', []):
+                self.logger.warning(f"    ! {warning}")
         except Exception as e:
             self.logger.error(f"  ✗ Database loading failed: {str(e)}", exc_info=True)
             raise
@@ -383,11 +418,12 @@ class ProtecAIPipeline:
         self.logger.info("="*80)
 
 
-def main():
+def main() -> int:
     """Main entry point"""
     pipeline = ProtecAIPipeline()
     pipeline.run()
+    return 0
 
 
 if __name__ == '__main__':
-    main()
+    sys.exit(main())
@@ -123,11 +123,12 @@ class NormalizationPipeline:
         self.logger.info("="*80)
 
 
-def main():
+def main() -> int:
     """Main entry point"""
     pipeline = NormalizationPipeline()
     pipeline.run()
+    return 0
 
 
 if __name__ == '__main__':
-    main()
+    sys.exit(main())
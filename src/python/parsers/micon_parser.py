@@ -14,8 +14,8 @@ from ..utils.filename_parser import FilenameParser
 class MiconParser:
     """Parser for MICON relay PDF files"""
     
-    def __init__(self):
-        self.extractor = PdfExtractor()
+    def __init__(self, text_cache_dir: Optional[str] = None):
+        self.extractor = PdfExtractor(text_cache_dir=text_cache_dir)
         self.filename_parser = FilenameParser()
         self.manufacturer = 'GENERAL ELECTRIC'
     
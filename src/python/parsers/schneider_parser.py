@@ -41,13 +41,17 @@ class SchneiderParser:
         manufacturer (str): Fabricante dos relés ('SCHNEIDER ELECTRIC')
     """
     
-    def __init__(self) -> None:
+    def __init__(self, text_cache_dir: Optional[str] = None) -> None:
         """Inicializa o parser Schneider com extratores apropriados.
         
         Configura extrator de PDF, parser de nomes de arquivo e define
         fabricante padrão.
+        
+        Args:
+            text_cache_dir: Diretório do cache em disco do texto extraído
+                (None = apenas cache em memória)
         """
-        self.extractor = PdfExtractor()
+        self.extractor = PdfExtractor(text_cache_dir=text_cache_dir)
         self.filename_parser = FilenameParser()
         self.manufacturer = 'SCHNEIDER ELECTRIC'
     
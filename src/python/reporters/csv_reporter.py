@@ -3,20 +3,32 @@ Exportador de relatórios em formato CSV
 """
 import pandas as pd
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Iterable, Optional
 from .base_reporter import BaseReporter
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 
 class CSVReporter(BaseReporter):
     """Gera relatórios em formato CSV com metadados no cabeçalho"""
     
+    # Motor de escrita: pandas por padrão; pyarrow (writer em C++) só quando pedido,
+    # pois o CSV gerado difere (aspas, true/false, 3.0 -> 3, decimais)
+    DEFAULT_ENGINE = 'pandas'
+    
     def export(
         self,
         df: pd.DataFrame,
         report_code: str,
         report_name: str,
         report_title: str,
-        include_header: bool = True
+        include_header: bool = True,
+        engine: Optional[str] = None
     ) -> Path:
         """
         Exporta DataFrame para CSV com cabeçalho de metadados
@@ -27,6 +39,7 @@ class CSVReporter(BaseReporter):
             report_name: Nome descritivo (ex: fabricantes_reles)
             report_title: Título completo do relatório
             include_header: Se True, inclui cabeçalho com metadados
+            engine: 'pyarrow' ou 'pandas' (default: DEFAULT_ENGINE)
         
         Returns:
             Path do arquivo gerado
@@ -35,20 +48,107 @@ class CSVReporter(BaseReporter):
         
         output_path = self.get_output_path(report_code, report_name, 'csv')
         
-        with open(output_path, 'w', encoding='utf-8') as f:
+        with open(output_path, 'wb') as f:
             if include_header:
-                # Cabeçalho com metadados
-                footer = self.format_footer_text(report_title)
-                f.write(f"# {self.HEADER_TITLE}\n")
-                f.write(f"# {report_title}\n")
-                f.write(f"# {footer['left']}\n")
-                f.write("#\n")
+                self._write_metadata(f, report_title)
             
             # Dados
-            df.to_csv(f, index=False, encoding='utf-8')
+            self._write_frame(f, df, header=True, engine=engine)
         
         return output_path
     
+    def export_stream(
+        self,
+        chunks: Iterable[pd.DataFrame],
+        report_code: str,
+        report_name: str,
+        report_title: str,
+        include_header: bool = True,
+        engine: Optional[str] = None
+    ) -> Path:
+        """
+        Exporta uma sequência de DataFrames (blocos) para um único CSV
+        
+        O cabeçalho de colunas é escrito apenas no primeiro bloco, de modo que
+        o arquivo final é idêntico ao gerado por export() com o DataFrame inteiro.
+        
+        Args:
+            chunks: Iterável de DataFrames com as mesmas colunas
+            report_code: Código do relatório (ex: REL06)
+            report_name: Nome descritivo
+            report_title: Título completo do relatório
+            include_header: Se True, inclui cabeçalho com metadados
+            engine: 'pyarrow' ou 'pandas' (default: DEFAULT_ENGINE), o mesmo
+                para todos os blocos
+        
+        Returns:
+            Path do arquivo gerado
+        """
+        # Um único motor para o arquivo inteiro: com pyarrow, um bloco que não
+        # converte gera erro em vez de cair para pandas no meio do arquivo
+        engine = self._resolve_engine(engine)
+        output_path = self.get_output_path(report_code, report_name, 'csv')
+        
+        with open(output_path, 'wb') as f:
+            if include_header:
+                self._write_metadata(f, report_title)
+            
+            for i, chunk in enumerate(chunks):
+                self._write_frame(f, chunk, header=(i == 0), engine=engine, fallback=False)
+        
+        return output_path
+    
+    def _write_metadata(self, f: BinaryIO, report_title: str):
+        """Escreve as linhas de metadados (# ...) no início do arquivo"""
+        footer = self.format_footer_text(report_title)
+        lines = (
+            f"# {self.HEADER_TITLE}\n"
+            f"# {report_title}\n"
+            f"# {footer['left']}\n"
+            "#\n"
+        )
+        f.write(lines.encode('utf-8'))
+    
+    def _resolve_engine(self, engine: Optional[str]) -> str:
+        """Motor efetivo: 'pyarrow' só se pedido e instalado, senão 'pandas'"""
+        engine = engine or self.DEFAULT_ENGINE
+        return 'pyarrow' if engine == 'pyarrow' and PYARROW_AVAILABLE else 'pandas'
+    
+    def _write_frame(
+        self,
+        f: BinaryIO,
+        df: pd.DataFrame,
+        header: bool,
+        engine: Optional[str] = None,
+        fallback: bool = True
+    ):
+        """
+        Escreve as linhas do DataFrame no arquivo aberto em modo binário
+        
+        Com pyarrow, o DataFrame é convertido para uma tabela Arrow e gravado
+        pelo writer em C++; se a conversão falhar (colunas object com tipos
+        mistos, por exemplo), cai para ``df.to_csv`` quando ``fallback`` é
+        True, senão propaga o erro.
+        """
+        if self._resolve_engine(engine) == 'pyarrow':
+            try:
+                table = pa.Table.from_pandas(df, preserve_index=False)
+                pa_csv.write_csv(
+                    table,
+                    f,
+                    write_options=pa_csv.WriteOptions(
+                        include_header=header,
+                        delimiter=',',
+                        quoting_style='needed'
+                    )
+                )
+                return
+            except (pa.ArrowException, TypeError, ValueError):
+                if not fallback:
+                    raise
+        
+        df.to_csv(f, index=False, header=header, encoding='utf-8')
+    
     def export_multiple_sections(
         self,
         sections: dict,
@@ -16,6 +16,13 @@ from .base_reporter import BaseReporter
 class PDFReporter(BaseReporter):
     """Gera relatórios em formato PDF com formatação Petrobras"""
     
+    # Acima deste número de linhas as alturas das linhas são pré-calculadas,
+    # evitando que o reportlab meça todas as células a cada quebra de página
+    LARGE_TABLE_ROWS = 500
+    
+    # Leading padrão das células de Table (FONTSIZE não altera o leading)
+    CELL_LEADING = 12
+    
     def __init__(self, output_base_path: Optional[Path] = None):
         super().__init__(output_base_path)
         
@@ -48,7 +55,8 @@ class PDFReporter(BaseReporter):
         report_code: str,
         report_name: str,
         report_title: str,
-        orientation: str = 'portrait'
+        orientation: str = 'portrait',
+        prerendered: Optional[List[List[str]]] = None
     ) -> Path:
         """
         Exporta DataFrame para PDF com formatação
@@ -59,6 +67,7 @@ class PDFReporter(BaseReporter):
             report_name: Nome descritivo (ex: fabricantes_reles)
             report_title: Título completo do relatório
             orientation: 'portrait' ou 'landscape'
+            prerendered: Células de df já convertidas para texto (opcional)
         
         Returns:
             Path do arquivo gerado
@@ -93,16 +102,20 @@ class PDFReporter(BaseReporter):
         elements.append(Spacer(1, 0.5*cm))
         
         # Tabela de dados - converter para strings e limitar comprimento
+        rows = prerendered if prerendered is not None else df.values.tolist()
         table_data = [df.columns.tolist()] + [
-            [self._truncate_text(str(val), 80) for val in row] 
-            for row in df.values.tolist()
+            [self._truncate_text(val, 80) for val in row] 
+            for row in rows
         ]
         
         # Calcular larguras dinâmicas baseadas no conteúdo
         available_width = pagesize[0] - 4*cm
-        col_widths = self._calculate_column_widths(df, available_width)
+        col_widths = self._calculate_column_widths(df, available_width, prerendered)
         
-        table = Table(table_data, colWidths=col_widths, repeatRows=1)
+        # Tabelas grandes: alturas explícitas (mesmo cálculo do reportlab)
+        row_heights = self._calculate_row_heights(table_data) if len(df) > self.LARGE_TABLE_ROWS else None
+        
+        table = Table(table_data, colWidths=col_widths, rowHeights=row_heights, repeatRows=1)
         
         # Estilo da tabela
         table_style = TableStyle([
@@ -274,7 +287,12 @@ class PDFReporter(BaseReporter):
         
         canvas.restoreState()
     
-    def _calculate_column_widths(self, df: pd.DataFrame, available_width: float) -> list:
+    def _calculate_column_widths(
+        self,
+        df: pd.DataFrame,
+        available_width: float,
+        prerendered: Optional[List[List[str]]] = None
+    ) -> list:
         """
         Calcula larguras dinâmicas das colunas baseadas no conteúdo
         
@@ -282,17 +300,26 @@ class PDFReporter(BaseReporter):
         1. Analisa comprimento máximo de cada coluna (header + dados)
         2. Distribui largura proporcionalmente
         3. Garante mínimo de 2cm e máximo de 8cm por coluna
+        
+        Se ``prerendered`` for informado, os comprimentos vêm das strings já
+        convertidas em vez de um novo ``astype(str)`` por coluna.
         """
         if df.empty or len(df.columns) == 0:
             return [available_width]
         
+        if prerendered is not None:
+            max_lens = [max(map(len, col)) for col in zip(*prerendered)]
+        
         # Calcular comprimento máximo de cada coluna
         col_lengths = []
-        for col in df.columns:
+        for i, col in enumerate(df.columns):
             # Comprimento do header
             header_len = len(str(col))
             # Comprimento máximo dos dados (limitado a 80 chars)
-            data_len = df[col].astype(str).str.len().max() if not df.empty else 10
+            if prerendered is not None:
+                data_len = max_lens[i]
+            else:
+                data_len = df[col].astype(str).str.len().max() if not df.empty else 10
             data_len = min(data_len, 80)  # Limite para evitar colunas muito largas
             col_lengths.append(max(header_len, data_len))
         
@@ -319,6 +346,20 @@ class PDFReporter(BaseReporter):
         
         return col_widths
     
+    def _calculate_row_heights(self, table_data: list) -> list:
+        """
+        Calcula a altura de cada linha da tabela como o reportlab faria
+        
+        Altura = maior número de linhas de texto da linha x leading + paddings
+        (cabeçalho: 3 + 12; dados: 4 + 4, conforme o TableStyle de export).
+        """
+        heights = []
+        for row_idx, row in enumerate(table_data):
+            lines = max((str(val).count('\n') + 1 if val else 1) for val in row)
+            padding = 15 if row_idx == 0 else 8
+            heights.append(lines * self.CELL_LEADING + padding)
+        return heights
+    
     @staticmethod
     def _truncate_text(text: str, max_length: int = 80) -> str:
         """
@@ -27,15 +27,39 @@ Exemplo de uso:
     >>> generator.generate_report('REL01', formats=['csv', 'xlsx', 'pdf'])
     >>> generator.generate_all_reports(formats=['xlsx'])
 """
-import psycopg2
-import pandas as pd
+from __future__ import annotations
+
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from types import MappingProxyType
+from typing import Optional, List, Dict, Any, Iterator, Tuple, TYPE_CHECKING
 from datetime import datetime
 
-from .csv_reporter import CSVReporter
-from .excel_reporter import ExcelReporter
-from .pdf_reporter import PDFReporter
+# psycopg2, pandas e os reporters (openpyxl/reportlab) são importados sob demanda:
+# listar relatórios ou instanciar o gerador não paga o custo dessas importações
+if TYPE_CHECKING:
+    import pandas as pd
+    from .csv_reporter import CSVReporter
+    from .excel_reporter import ExcelReporter
+    from .pdf_reporter import PDFReporter
+
+
+def _mapping_from_pairs(pairs: List[tuple]) -> Dict[str, str]:
+    """
+    Monta um dicionário a partir de pares (chave, valor), recusando chaves repetidas
+    
+    Num literal de dict uma chave duplicada sobrescreve a anterior em silêncio;
+    aqui ela gera erro na importação do módulo.
+    
+    Raises:
+        ValueError: Se alguma chave aparecer mais de uma vez
+    """
+    mapping: Dict[str, str] = {}
+    for key, value in pairs:
+        if key in mapping:
+            raise ValueError(f"Chave duplicada: {key!r}")
+        mapping[key] = value
+    return mapping
 
 
 class ReportGenerator:
@@ -56,6 +80,15 @@ class ReportGenerator:
     # Relatórios que devem ser SEMPRE em landscape (muitas colunas ou conteúdo longo)
     FORCE_LANDSCAPE = ['REL06', 'REL08', 'REL09']
     
+    # Views de catálogo (LEFT JOIN a partir de tabelas de referência) que sempre
+    # retornam linhas: dispensam a pré-verificação de existência de dados
+    SKIP_EMPTY_CHECK = {'vw_manufacturers_summary', 'vw_protection_functions_summary'}
+    
+    # Relatórios que materializam todos os relés/parâmetros: quando só CSV é pedido,
+    # são lidos com cursor no servidor e gravados em blocos (memória constante)
+    STREAM_REPORTS = {'REL06', 'REL09'}
+    STREAM_CHUNK_SIZE = 10_000
+    
     # Relatórios que usam abreviações especiais de Fabricante e Tensão
     REPORTS_WITH_SPECIAL_ABBREVIATIONS = ['REL02', 'REL03', 'REL04', 'REL05', 'REL06', 'REL07', 'REL08', 'REL09']
     
@@ -67,40 +100,35 @@ class ReportGenerator:
     }
     
     # Dicionário de abreviações para headers longos (aplicado em TODOS os relatórios)
-    HEADER_ABBREVIATIONS = {
-        'Código ANSI': 'Cd.ANSI',
-        'Nome da Função': 'Função',
-        'Classe de Tensão (kV)': 'C.Tensão\nkV',
-        'Total de Proteções': 'TotProt',
-        'Total de Instalações': 'TotInst',
-        'Total de Instâncias': 'TotInst',
-        'Lista de Parâmetros Críticos': 'L_Par_Crit',
-        'Código da Subestação': 'Cd.Subest',
-        'Total de Modelos': 'TotMod',
-        'Total de Relés': 'TotRelés',
-        'Tipo de Relé': 'Tipo\nRelé',
-        'ID Relé': 'ID\nRelé',
-        'Tipo de Parâmetro': 'Tipo\nParam',
-        'Nome da Função de Proteção': 'Função\nProteção',
-        'Total de TCs': 'Tot\nTCs',
-        'Total de TPs': 'Tot\nTPs',
-        'Total de Parâmetros': 'Tot\nParams',
-        'Proteções Habilitadas': 'Prot\nHabil',
-        'Data de Configuração': 'Data\nConfig',
-        'Versão de Software': 'Ver.\nSW',
-        'Versão de Firmware': 'Ver.\nFW',
-        'TP Definido': 'TP\nDef',
-        'TP Habilitado': 'TP\nHabil',
-        'Fonte de Tensão': 'Fonte\nTensão',
-        'Confiança da Tensão': 'Conf.\nTensão',
-        'Habilitadas': 'EN',
-        'Desabilitadas': 'DES',
-        'Código da Subestação': 'SE',
-        'Proteções Habilitadas': 'Prot\nHabil',
-        'Data de Configuração': 'Data\nConfig',
-        'Versão de Software': 'Ver.\nSW',
-        'Versão de Firmware': 'Ver.\nFW'
-    }
+    HEADER_ABBREVIATIONS = _mapping_from_pairs([
+        ('Código ANSI', 'Cd.ANSI'),
+        ('Nome da Função', 'Função'),
+        ('Classe de Tensão (kV)', 'C.Tensão\nkV'),
+        ('Total de Proteções', 'TotProt'),
+        ('Total de Instalações', 'TotInst'),
+        ('Total de Instâncias', 'TotInst'),
+        ('Lista de Parâmetros Críticos', 'L_Par_Crit'),
+        ('Código da Subestação', 'SE'),
+        ('Total de Modelos', 'TotMod'),
+        ('Total de Relés', 'TotRelés'),
+        ('Tipo de Relé', 'Tipo\nRelé'),
+        ('ID Relé', 'ID\nRelé'),
+        ('Tipo de Parâmetro', 'Tipo\nParam'),
+        ('Nome da Função de Proteção', 'Função\nProteção'),
+        ('Total de TCs', 'Tot\nTCs'),
+        ('Total de TPs', 'Tot\nTPs'),
+        ('Total de Parâmetros', 'Tot\nParams'),
+        ('Proteções Habilitadas', 'Prot\nHabil'),
+        ('Data de Configuração', 'Data\nConfig'),
+        ('Versão de Software', 'Ver.\nSW'),
+        ('Versão de Firmware', 'Ver.\nFW'),
+        ('TP Definido', 'TP\nDef'),
+        ('TP Habilitado', 'TP\nHabil'),
+        ('Fonte de Tensão', 'Fonte\nTensão'),
+        ('Confiança da Tensão', 'Conf.\nTensão'),
+        ('Habilitadas', 'EN'),
+        ('Desabilitadas', 'DES')
+    ])
     
     # Mapeamento de tradução de colunas para headers formatados
     COLUMN_TRANSLATIONS = {
@@ -189,8 +217,8 @@ class ReportGenerator:
         'confidence_levels': 'Níveis de Confiança'
     }
     
-    # Definição dos 9 relatórios
-    REPORTS = {
+    # Definição dos 9 relatórios (somente leitura)
+    REPORTS = MappingProxyType({
         'REL01': {
             'name': 'fabricantes_reles',
             'title': 'Relatório de Fabricantes de Relés',
@@ -246,7 +274,10 @@ class ReportGenerator:
             'view': 'vw_critical_parameters_consolidated',
             'description': 'Consolidação de parâmetros críticos por relé'
         }
-    }
+    })
+    
+    # Ordem de geração/listagem dos relatórios, calculada uma única vez
+    _REPORTS_ORDER: Tuple[str, ...] = tuple(sorted(REPORTS))
     
     def __init__(
         self,
@@ -279,25 +310,64 @@ class ReportGenerator:
         }
         self.schema = db_schema
         
-        # Instanciar reporters
-        self.csv_reporter = CSVReporter(output_base_path)
-        self.excel_reporter = ExcelReporter(output_base_path)
-        self.pdf_reporter = PDFReporter(output_base_path)
+        # Pool de conexões criado na primeira consulta e reaproveitado entre relatórios
+        self._pool = None
+        
+        # Mapeamentos de colunas já resolvidos: (report_code, colunas) -> {original: traduzido}
+        self._mapping_cache: Dict[tuple, Dict[str, str]] = {}
+        
+        # Reporters instanciados no primeiro uso (ver propriedades abaixo)
+        self.output_base_path = output_base_path
+        self._csv_reporter: Optional[CSVReporter] = None
+        self._excel_reporter: Optional[ExcelReporter] = None
+        self._pdf_reporter: Optional[PDFReporter] = None
     
-    def translate_columns(self, df: pd.DataFrame, report_code: str = None) -> pd.DataFrame:
+    @property
+    def csv_reporter(self) -> CSVReporter:
+        """Reporter CSV (importado e instanciado no primeiro acesso)"""
+        if self._csv_reporter is None:
+            from .csv_reporter import CSVReporter
+            self._csv_reporter = CSVReporter(self.output_base_path)
+        return self._csv_reporter
+    
+    @property
+    def excel_reporter(self) -> ExcelReporter:
+        """Reporter Excel (importado e instanciado no primeiro acesso)"""
+        if self._excel_reporter is None:
+            from .excel_reporter import ExcelReporter
+            self._excel_reporter = ExcelReporter(self.output_base_path)
+        return self._excel_reporter
+    
+    @property
+    def pdf_reporter(self) -> PDFReporter:
+        """Reporter PDF (importado e instanciado no primeiro acesso)"""
+        if self._pdf_reporter is None:
+            from .pdf_reporter import PDFReporter
+            self._pdf_reporter = PDFReporter(self.output_base_path)
+        return self._pdf_reporter
+    
+    def _resolve_mapping(self, report_code: Optional[str], columns: tuple) -> Dict[str, str]:
         """
-        Traduz os nomes das colunas do DataFrame usando o mapeamento
-        e aplica abreviações para otimizar espaço nos relatórios
+        Resolve (com cache) o mapeamento coluna original -> header traduzido/abreviado
+        
+        As views são fixas, então a mesma tupla de colunas se repete a cada
+        geração do relatório: o mapeamento é calculado uma única vez.
         
         Args:
-            df: DataFrame com colunas em inglês/snake_case
-            report_code: Código do relatório (REL01-REL09) para abreviações específicas
+            report_code: Código do relatório (REL01-REL09) ou None
+            columns: Tupla com os nomes das colunas do DataFrame
             
         Returns:
-            DataFrame com colunas traduzidas, formatadas e abreviadas
+            Dict {coluna_original: coluna_traduzida}
         """
+        cache_key = (report_code, columns)
+        cached = self._mapping_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        use_special = report_code in self.REPORTS_WITH_SPECIAL_ABBREVIATIONS
         column_mapping = {}
-        for col in df.columns:
+        for col in columns:
             # Se existe tradução, usa; senão mantém original formatado
             if col in self.COLUMN_TRANSLATIONS:
                 translated = self.COLUMN_TRANSLATIONS[col]
@@ -306,22 +376,102 @@ class ReportGenerator:
                 translated = col.replace('_', ' ').title()
             
             # Aplicar abreviações gerais (todos os relatórios)
-            if translated in self.HEADER_ABBREVIATIONS:
-                abbreviated = self.HEADER_ABBREVIATIONS[translated]
-            else:
-                abbreviated = translated
+            abbreviated = self.HEADER_ABBREVIATIONS.get(translated, translated)
             
             # Aplicar abreviações especiais APENAS para relatórios específicos (sobrescreve abreviações gerais)
-            if report_code in self.REPORTS_WITH_SPECIAL_ABBREVIATIONS and abbreviated in self.SPECIAL_ABBREVIATIONS:
+            if use_special and abbreviated in self.SPECIAL_ABBREVIATIONS:
                 column_mapping[col] = self.SPECIAL_ABBREVIATIONS[abbreviated]
             else:
                 column_mapping[col] = abbreviated
         
-        return df.rename(columns=column_mapping)
+        self._mapping_cache[cache_key] = column_mapping
+        return column_mapping
+    
+    def translate_columns(self, df: pd.DataFrame, report_code: str = None) -> pd.DataFrame:
+        """
+        Traduz os nomes das colunas do DataFrame usando o mapeamento
+        e aplica abreviações para otimizar espaço nos relatórios
+        
+        Args:
+            df: DataFrame com colunas em inglês/snake_case
+            report_code: Código do relatório (REL01-REL09) para abreviações específicas
+            
+        Returns:
+            DataFrame com colunas traduzidas, formatadas e abreviadas
+        """
+        column_mapping = self._resolve_mapping(report_code, tuple(df.columns))
+        return df.rename(columns=column_mapping, copy=False)
+    
+    @staticmethod
+    def _to_string_matrix(df: pd.DataFrame) -> List[List[str]]:
+        """
+        Converte o DataFrame em matriz de strings (linhas x colunas) para o PDF
+        
+        A conversão é feita coluna a coluna: colunas de texto, inteiras e booleanas
+        usam ``astype(str)`` (laço em C do pandas); as demais (float,
+        datas) usam ``str()`` por valor para manter a mesma representação de
+        ``str(val)`` sobre ``df.values``.
+        
+        Args:
+            df: DataFrame já traduzido
+        
+        Returns:
+            Lista de linhas, cada uma com as células já em texto
+        """
+        columns = []
+        for col in df.columns:
+            series = df[col]
+            if series.dtype.kind in 'iubO':
+                columns.append(series.astype(str).tolist())
+            else:
+                columns.append([str(val) for val in series.tolist()])
+        
+        return [list(row) for row in zip(*columns)]
+    
+    @contextmanager
+    def get_connection(self) -> Iterator[Any]:
+        """
+        Empresta uma conexão do pool (criado no primeiro uso)
+        
+        A conexão é devolvida ao pool ao sair do bloco ``with``; transações
+        abertas são desfeitas pelo próprio pool na devolução.
+        """
+        if self._pool is None:
+            from psycopg2.pool import ThreadedConnectionPool
+            self._pool = ThreadedConnectionPool(minconn=1, maxconn=16, **self.db_config)
+        
+        conn = self._pool.getconn()
+        try:
+            yield conn
+        finally:
+            self._pool.putconn(conn)
     
-    def get_connection(self):
-        """Cria conexão com o banco de dados"""
-        return psycopg2.connect(**self.db_config)
+    def close(self):
+        """Fecha todas as conexões do pool"""
+        if self._pool is not None:
+            self._pool.closeall()
+            self._pool = None
+    
+    def _has_rows(self, view_name: str, filter_clause: Optional[str] = None) -> bool:
+        """
+        Verifica se a view retorna ao menos uma linha (SELECT 1 ... LIMIT 1)
+        
+        Args:
+            view_name: Nome da view
+            filter_clause: Cláusula WHERE opcional
+        
+        Returns:
+            True se existe ao menos um registro
+        """
+        query = f"SELECT 1 FROM {self.schema}.{view_name}"
+        if filter_clause:
+            query += f" WHERE {filter_clause}"
+        query += " LIMIT 1"
+        
+        with self.get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(query)
+                return cur.fetchone() is not None
     
     def fetch_data(self, view_name: str, filter_clause: Optional[str] = None) -> pd.DataFrame:
         """
@@ -334,6 +484,8 @@ class ReportGenerator:
         Returns:
             DataFrame com os dados
         """
+        import pandas as pd
+        
         query = f"SELECT * FROM {self.schema}.{view_name}"
         if filter_clause:
             query += f" WHERE {filter_clause}"
@@ -343,6 +495,43 @@ class ReportGenerator:
         
         return df
     
+    def fetch_data_stream(
+        self,
+        view_name: str,
+        filter_clause: Optional[str] = None,
+        chunk_size: Optional[int] = None
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Busca dados de uma view em blocos, via cursor nomeado (server-side)
+        
+        Args:
+            view_name: Nome da view
+            filter_clause: Cláusula WHERE opcional
+            chunk_size: Linhas por bloco (default: STREAM_CHUNK_SIZE)
+        
+        Yields:
+            DataFrames com no máximo chunk_size linhas
+        """
+        import pandas as pd
+        
+        chunk_size = chunk_size or self.STREAM_CHUNK_SIZE
+        
+        query = f"SELECT * FROM {self.schema}.{view_name}"
+        if filter_clause:
+            query += f" WHERE {filter_clause}"
+        
+        with self.get_connection() as conn:
+            with conn.cursor(name=f'stream_{view_name}') as cur:
+                cur.itersize = chunk_size
+                cur.execute(query)
+                while True:
+                    rows = cur.fetchmany(chunk_size)
+                    if not rows:
+                        break
+                    # Em cursores nomeados, description só existe após o primeiro fetch
+                    columns = [d.name for d in cur.description]
+                    yield pd.DataFrame(rows, columns=columns)
+    
     def generate_report(
         self,
         report_code: str,
@@ -363,12 +552,21 @@ class ReportGenerator:
         
         report_config = self.REPORTS[report_code]
         
+        view_name = report_config['view']
+        filter_clause = report_config.get('filter')
+        
         # Buscar dados
         print(f"Gerando {report_code}: {report_config['title']}")
-        df = self.fetch_data(
-            report_config['view'],
-            report_config.get('filter')
-        )
+        
+        # Relatório vazio: retornar sem montar o DataFrame
+        if view_name not in self.SKIP_EMPTY_CHECK and not self._has_rows(view_name, filter_clause):
+            print(f"  ⚠️  AVISO: Nenhum dado encontrado para {report_code}")
+            return {}
+        
+        if report_code in self.STREAM_REPORTS and list(formats) == ['csv']:
+            return self._generate_csv_stream(report_code, view_name, filter_clause)
+        
+        df = self.fetch_data(view_name, filter_clause)
         
         if df.empty:
             print(f"  ⚠️  AVISO: Nenhum dado encontrado para {report_code}")
@@ -418,13 +616,52 @@ class ReportGenerator:
                 report_code,
                 report_config['name'],
                 report_config['title'],
-                orientation=orientation
+                orientation=orientation,
+                prerendered=self._to_string_matrix(df)
             )
             generated_files['pdf'] = pdf_path
             print(f"  ✅ PDF: {pdf_path.name}")
         
         return generated_files
     
+    def _generate_csv_stream(
+        self,
+        report_code: str,
+        view_name: str,
+        filter_clause: Optional[str]
+    ) -> Dict[str, Path]:
+        """
+        Gera o CSV de um relatório grande bloco a bloco, sem montar o DataFrame inteiro
+        
+        Args:
+            report_code: Código do relatório
+            view_name: Nome da view
+            filter_clause: Cláusula WHERE opcional
+        
+        Returns:
+            Dict com {'csv': path_do_arquivo}
+        """
+        report_config = self.REPORTS[report_code]
+        total = 0
+        
+        def translated_chunks():
+            nonlocal total
+            for chunk in self.fetch_data_stream(view_name, filter_clause):
+                total += len(chunk)
+                yield self.translate_columns(chunk, report_code=report_code)
+        
+        csv_path = self.csv_reporter.export_stream(
+            translated_chunks(),
+            report_code,
+            report_config['name'],
+            report_config['title']
+        )
+        
+        print(f"  📊 {total} registros encontrados")
+        print(f"  ✅ CSV: {csv_path.name}")
+        
+        return {'csv': csv_path}
+    
     def generate_all_reports(
         self,
         formats: List[str] = ['csv', 'xlsx', 'pdf']
@@ -449,15 +686,18 @@ class ReportGenerator:
         
         all_generated = {}
         
-        for report_code in sorted(self.REPORTS.keys()):
-            try:
-                generated = self.generate_report(report_code, formats)
-                all_generated[report_code] = generated
-                print()
-            except Exception as e:
-                print(f"  ❌ ERRO ao gerar {report_code}: {str(e)}")
-                print()
-                continue
+        try:
+            for report_code in self._REPORTS_ORDER:
+                try:
+                    generated = self.generate_report(report_code, formats)
+                    all_generated[report_code] = generated
+                    print()
+                except Exception as e:
+                    print(f"  ❌ ERRO ao gerar {report_code}: {str(e)}")
+                    print()
+                    continue
+        finally:
+            self.close()
         
         print("=" * 80)
         print(f"CONCLUÍDO: {len(all_generated)}/{len(self.REPORTS)} relatórios gerados")
@@ -486,6 +726,8 @@ class ReportGenerator:
         Returns:
             Dict com {formato: path_do_arquivo}
         """
+        import pandas as pd
+        
         print(f"Gerando relatório customizado: {report_code}")
         
         with self.get_connection() as conn:
@@ -526,7 +768,8 @@ class ReportGenerator:
         print("RELATÓRIOS DISPONÍVEIS")
         print("=" * 80)
         
-        for code, config in sorted(self.REPORTS.items()):
+        for code in self._REPORTS_ORDER:
+            config = self.REPORTS[code]
             print(f"\n{code}: {config['title']}")
             print(f"  View: {config['view']}")
             print(f"  Descrição: {config['description']}")
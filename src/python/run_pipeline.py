@@ -21,10 +21,19 @@ RESULTADO ESPERADO:
   • 4 CTs, 5 VTs
 
 NOTA: Relatórios são gerados SOB DEMANDA via generate_reports.py
+
+USO:
+  python src/python/run_pipeline.py              # fases no mesmo processo
+  python src/python/run_pipeline.py --isolated   # cada fase em subprocesso (debug)
 """
 
+import os
+import io
 import sys
+import argparse
+import importlib
 import subprocess
+from contextlib import redirect_stdout, redirect_stderr
 from pathlib import Path
 from datetime import datetime
 
@@ -45,50 +54,129 @@ def run_phase(phase_name: str, script_path: str, logger: PipelineLogger) -> bool
     logger.section(f"FASE: {phase_name}")
     
     try:
-        result = subprocess.run(
+        # stderr redirecionado para stdout: saída registrada em tempo real,
+        # sem acumular todo o output do processo filho em memória
+        proc = subprocess.Popen(
             [sys.executable, str(script_path)],
             cwd=str(project_root),
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
             text=True,
-            check=True
+            bufsize=1,
+            env={**os.environ, 'PYTHONUNBUFFERED': '1'}
         )
         
         # Log output
-        if result.stdout:
-            for line in result.stdout.split('\n'):
-                if line.strip():
-                    logger.info(line)
+        for line in proc.stdout:
+            line = line.rstrip()
+            if line.strip():
+                logger.info(line)
+        
+        returncode = proc.wait()
+        
+        if returncode != 0:
+            logger.error(f"❌ ERRO em {phase_name}")
+            logger.error(f"Código de saída: {returncode}")
+            return False
         
         logger.info(f"✅ {phase_name} CONCLUÍDA COM SUCESSO")
         return True
         
-    except subprocess.CalledProcessError as e:
-        logger.error(f"❌ ERRO em {phase_name}")
-        logger.error(f"Código de saída: {e.returncode}")
-        
-        if e.stdout:
-            logger.error("STDOUT:")
-            for line in e.stdout.split('\n'):
-                if line.strip():
-                    logger.error(f"  {line}")
+    except Exception as e:
+        logger.error(f"❌ EXCEÇÃO em {phase_name}: {str(e)}")
+        return False
+
+
+class _LoggerStream(io.TextIOBase):
+    """Stream de texto que encaminha cada linha completa para o PipelineLogger"""
+    
+    def __init__(self, logger: PipelineLogger):
+        self.logger = logger
+        self._pending = ''
+        self._emitting = False
+    
+    def write(self, text: str) -> int:
+        # Reentrada: registro do próprio logger voltando por um handler
+        # ligado a este stream (ex.: logging.basicConfig dentro da fase)
+        if self._emitting:
+            return len(text)
         
-        if e.stderr:
-            logger.error("STDERR:")
-            for line in e.stderr.split('\n'):
+        self._pending += text
+        *lines, self._pending = self._pending.split('\n')
+        self._emit(lines)
+        return len(text)
+    
+    def flush(self):
+        if not self._emitting:
+            self._emit([self._pending])
+            self._pending = ''
+    
+    def _emit(self, lines):
+        self._emitting = True
+        try:
+            for line in lines:
                 if line.strip():
-                    logger.error(f"  {line}")
-        
-        return False
+                    self.logger.info(line.rstrip())
+        finally:
+            self._emitting = False
+
+
+def run_phase_inprocess(phase_name: str, module_name: str, logger: PipelineLogger) -> bool:
+    """
+    Executa uma fase da pipeline no próprio processo, chamando main() do módulo
+    
+    Evita o custo de subir um novo interpretador e reimportar pandas/psycopg2
+    a cada fase. A saída da fase (print e logging) é encaminhada ao logger.
+    
+    Returns:
+        True se sucesso, False se erro
+    """
+    logger.section(f"FASE: {phase_name}")
+    
+    stream = _LoggerStream(logger)
+    
+    try:
+        with redirect_stdout(stream), redirect_stderr(stream):
+            phase_main = importlib.import_module(module_name).main
+            returncode = phase_main() or 0
+    except SystemExit as e:
+        # Mesma semântica do interpretador: sys.exit() / sys.exit(None) é sucesso
+        if e.code is None:
+            returncode = 0
+        else:
+            returncode = e.code if isinstance(e.code, int) else 1
     except Exception as e:
-        logger.error(f"❌ EXCEÇÃO em {phase_name}: {str(e)}")
+        stream.flush()
+        logger.error(f"❌ EXCEÇÃO em {phase_name}: {str(e)}", exc_info=True)
         return False
+    
+    stream.flush()
+    
+    if returncode != 0:
+        logger.error(f"❌ ERRO em {phase_name}")
+        logger.error(f"Código de saída: {returncode}")
+        return False
+    
+    logger.info(f"✅ {phase_name} CONCLUÍDA COM SUCESSO")
+    return True
 
 
 def main():
     """Executa pipeline completa de dados"""
     
+    parser = argparse.ArgumentParser(description='Pipeline completa de dados ProtecAI')
+    parser.add_argument(
+        '--isolated',
+        action='store_true',
+        help='Executa cada fase em um subprocesso Python separado (debug)'
+    )
+    args = parser.parse_args()
+    
     # Initialize logger
-    logger = PipelineLogger(log_dir=str(project_root / 'logs'))
+    # Nome próprio: as fases em processo criam PipelineLogger('protecai_pipeline')
+    logger = PipelineLogger(name='protecai_run_pipeline', log_dir=str(project_root / 'logs'))
+    # Fases podem configurar o root logger (logging.basicConfig) sobre o stdout redirecionado
+    logger.logger.propagate = False
     
     start_time = datetime.now()
     
@@ -103,16 +191,19 @@ def main():
         {
             'name': 'FASE 1 - EXTRAÇÃO',
             'script': project_root / 'src' / 'python' / 'main.py',
+            'module': 'src.python.main',
             'description': 'Extrai dados de PDFs e TXTs → CSV/Excel'
         },
         {
             'name': 'FASE 2 - NORMALIZAÇÃO',
             'script': project_root / 'src' / 'python' / 'normalize.py',
+            'module': 'src.python.normalize',
             'description': 'Normaliza CSVs para 3FN → norm_csv'
         },
         {
             'name': 'FASE 3 - CARGA NO BANCO',
             'script': project_root / 'src' / 'python' / 'test_loader.py',
+            'module': 'src.python.test_loader',
             'description': 'Carrega dados normalizados → PostgreSQL'
         }
     ]
@@ -126,7 +217,10 @@ def main():
         logger.info(f"Script: {phase['script'].name}")
         logger.info(f"{'=' * 80}\n")
         
-        success = run_phase(phase['name'], phase['script'], logger)
+        if args.isolated:
+            success = run_phase(phase['name'], phase['script'], logger)
+        else:
+            success = run_phase_inprocess(phase['name'], phase['module'], logger)
         results.append({
             'fase': phase['name'],
             'success': success
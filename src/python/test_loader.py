@@ -2,37 +2,52 @@
 """Script de teste do database loader"""
 import sys
 from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from database.database_loader import DatabaseLoader
-import logging
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
 
-logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
+from src.python.database.database_loader import DatabaseLoader
+import logging
 
-print("=" * 80)
-print("TESTE DO DATABASE LOADER")
-print("=" * 80)
 
-loader = DatabaseLoader()
+def main() -> int:
+    """Carrega os CSVs normalizados no banco (FASE 3)"""
+    logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 
-try:
-    stats = loader.load_all(force=True)
-    
-    print("\n" + "=" * 80)
-    print("ESTATÍSTICAS FINAIS")
     print("=" * 80)
-    print(f"Relés carregados: {stats['relays']}")
-    print(f"Erros: {len(stats['errors'])}")
-    
-    if stats['errors']:
-        print("\nErros encontrados:")
-        for error in stats['errors']:
-            print(f"  - {error}")
-    
-    print("\n✅ TESTE CONCLUÍDO")
-    
-except Exception as e:
-    print(f"\n❌ ERRO: {e}")
-    import traceback
-    traceback.print_exc()
-    sys.exit(1)
+    print("TESTE DO DATABASE LOADER")
+    print("=" * 80)
+
+    loader = DatabaseLoader()
+
+    try:
+        stats = loader.load_all(force=True)
+
+        print("\n" + "=" * 80)
+        print("ESTATÍSTICAS FINAIS")
+        print("=" * 80)
+        print(f"Relés carregados: {stats['relays']}")
+        print(f"Erros: {len(stats['errors'])}")
+
+        if stats['errors']:
+            print("\nErros encontrados:")
+            for error in stats['errors']:
+                print(f"  - {error}")
+
+        if stats.get('warnings'):
+            print("\nAvisos:")
+            for warning in stats['warnings']:
+                print(f"  - {warning}")
+
+        print("\n✅ TESTE CONCLUÍDO")
+        return 0
+
+    except Exception as e:
+        print(f"\n❌ ERRO: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
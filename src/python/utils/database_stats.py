@@ -13,13 +13,59 @@ Exemplo:
 Atributos:
     db_config (dict): Configuração de conexão com PostgreSQL
     schema (str): Nome do schema no banco de dados
+
+Os resumos por fabricante, tipo e classe de tensão são lidos das tabelas
+``stats_cache_*``, mantidas por triggers (docker/postgres/migrations/002_stats_cache.sql).
+Em bancos sem essa migração os resumos são calculados ao vivo com ``GROUP BY``.
 """
 
+import atexit
+import threading
+import time
+import weakref
+import zlib
 import psycopg2
-from typing import Dict, List, Any, Optional
+from contextlib import contextmanager
+from functools import wraps
+from psycopg2 import errors, sql
+from psycopg2.pool import ThreadedConnectionPool
+from typing import Callable, ClassVar, Dict, Iterator, List, Any, Optional, Tuple
 from datetime import datetime
 
 
+# Linhas lidas por chamada de fetchmany nos resumos
+FETCH_BATCH_SIZE = 1000
+
+
+def _fetchmany_iter(cur, size: int = FETCH_BATCH_SIZE) -> Iterator[tuple]:
+    """Gera as linhas de um cursor em lotes de ``fetchmany(size)``."""
+    while True:
+        rows = cur.fetchmany(size)
+        if not rows:
+            return
+        yield from rows
+
+
+def _ttl_cached(method: Callable) -> Callable:
+    """Memoiza o resultado de um método de leitura por ``self.cache_ttl`` segundos.
+    
+    O valor fica em ``self._cache`` com o instante (``time.monotonic``) da
+    consulta; ``cache_ttl=0`` desativa o cache.
+    """
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (method.__name__, args, tuple(sorted(kwargs.items())))
+        if self.cache_ttl > 0:
+            cached = self._cache.get(key)
+            if cached is not None and time.monotonic() - cached[1] < self.cache_ttl:
+                return cached[0]
+        
+        value = method(self, *args, **kwargs)
+        self._cache[key] = (value, time.monotonic())
+        return value
+    return wrapper
+
+
 class DatabaseStats:
     """Cliente para consulta de estatísticas do banco de dados de relés.
     
@@ -32,6 +78,14 @@ class DatabaseStats:
         schema (str): Nome do schema onde residem as tabelas do sistema
     """
     
+    # Pools de conexão compartilhados entre instâncias, um por configuração de banco
+    POOL_MAX_CONNECTIONS: ClassVar[int] = 10
+    _pools: ClassVar[Dict[Tuple, ThreadedConnectionPool]] = {}
+    _pools_lock: ClassVar[threading.Lock] = threading.Lock()
+    
+    # Nomes dos statements já preparados (PREPARE) em cada conexão do pool
+    _prepared: ClassVar[weakref.WeakKeyDictionary] = weakref.WeakKeyDictionary()
+    
     def __init__(
         self,
         db_host: str = 'localhost',
@@ -39,7 +93,8 @@ class DatabaseStats:
         db_name: str = 'protecai_db',
         db_user: str = 'protecai',
         db_password: str = 'protecai',
-        db_schema: str = 'protec_ai'
+        db_schema: str = 'protec_ai',
+        cache_ttl: float = 60.0
     ) -> None:
         """Inicializa o cliente de estatísticas do banco de dados.
         
@@ -50,6 +105,8 @@ class DatabaseStats:
             db_user: Usuário para autenticação (padrão: 'protecai')
             db_password: Senha para autenticação (padrão: 'protecai')
             db_schema: Schema do banco de dados (padrão: 'protec_ai')
+            cache_ttl: Validade em segundos das estatísticas memoizadas (padrão: 60;
+                0 desativa o cache)
         """
         self.db_config = {
             'host': db_host,
@@ -59,60 +116,259 @@ class DatabaseStats:
             'password': db_password
         }
         self.schema = db_schema
+        self.cache_ttl = cache_ttl
+        self._cache: Dict[Tuple, Tuple[Any, float]] = {}
+        # Instante (time.monotonic) da última verificação de conexão bem-sucedida
+        self._last_ok_ts: Optional[float] = None
+        self._check_ttl = 5.0
     
-    def get_connection(self) -> psycopg2.extensions.connection:
-        """Estabelece conexão com o banco de dados PostgreSQL.
+    @contextmanager
+    def get_connection(self) -> Iterator[psycopg2.extensions.connection]:
+        """Empresta uma conexão do pool compartilhado com o banco PostgreSQL.
         
-        Returns:
+        O pool é criado no primeiro uso (e não no construtor), para que a
+        instância possa existir com o banco offline. A conexão volta ao pool
+        ao sair do bloco ``with``.
+        
+        Yields:
             Objeto de conexão psycopg2 ativo.
             
         Raises:
             psycopg2.OperationalError: Se não conseguir conectar ao banco.
         """
-        return psycopg2.connect(**self.db_config)
+        key = tuple(sorted(self.db_config.items()))
+        with DatabaseStats._pools_lock:
+            pool = DatabaseStats._pools.get(key)
+            if pool is None:
+                pool = ThreadedConnectionPool(1, self.POOL_MAX_CONNECTIONS, **self.db_config)
+                DatabaseStats._pools[key] = pool
+        
+        conn = pool.getconn()
+        try:
+            yield conn
+        finally:
+            # Conexão derrubada pelo servidor não volta ao pool
+            pool.putconn(conn, close=bool(conn.closed))
     
-    def get_total_relays(self) -> int:
-        """Retorna o número total de relés cadastrados no sistema.
+    @classmethod
+    def close_pools(cls) -> None:
+        """Fecha todas as conexões de todos os pools (registrado no atexit)."""
+        with cls._pools_lock:
+            for pool in cls._pools.values():
+                pool.closeall()
+            cls._pools.clear()
+    
+    def _execute(self, cur, name: str, query: sql.Composable, params: tuple = ()) -> None:
+        """Executa uma query como prepared statement da sessão (PREPARE/EXECUTE).
+        
+        O statement é preparado na primeira execução em cada conexão e
+        reaproveitado nas seguintes, poupando parse e planejamento. O nome leva
+        um hash do texto da query, de modo que schemas diferentes não colidem.
+        
+        Args:
+            cur: Cursor da conexão emprestada do pool
+            name: Nome lógico da query (ex: 'count_relays')
+            query: Query composta com ``psycopg2.sql``; parâmetros como $1, $2...
+            params: Valores dos parâmetros $n
+            
+        Raises:
+            psycopg2.Error: Em caso de erro na consulta ao banco.
+        """
+        conn = cur.connection
+        text = query.as_string(conn)
+        stmt = sql.Identifier(f"stats_{name}_{zlib.crc32(text.encode()):08x}")
+        prepare = sql.SQL("PREPARE {} AS {}").format(stmt, sql.SQL(text))
+        prepared = DatabaseStats._prepared.setdefault(conn, set())
+        
+        if stmt.string not in prepared:
+            cur.execute(prepare)
+            prepared.add(stmt.string)
+        
+        execute = sql.SQL("EXECUTE {}").format(stmt)
+        if params:
+            execute += sql.SQL(" ({})").format(sql.SQL(', ').join(sql.Placeholder() * len(params)))
+        
+        try:
+            cur.execute(execute, params or None)
+        except errors.InvalidSqlStatementName:
+            # Sessão descartou os statements (DISCARD ALL, pooler externo): preparar de novo
+            conn.rollback()
+            cur.execute(prepare)
+            cur.execute(execute, params or None)
+    
+    def _exec_one(self, name: str, query: sql.Composable, params: tuple = ()) -> Any:
+        """Executa uma query preparada e retorna a primeira coluna da primeira linha.
         
+        Args:
+            name: Nome lógico da query
+            query: Query composta com ``psycopg2.sql``
+            params: Valores dos parâmetros $n (opcional)
+            
         Returns:
-            Quantidade total de registros na tabela de relés.
+            Valor escalar retornado pela query.
             
         Raises:
             psycopg2.Error: Em caso de erro na consulta ao banco.
         """
         with self.get_connection() as conn:
             with conn.cursor() as cur:
-                cur.execute(f"SELECT COUNT(*) FROM {self.schema}.relays")
+                self._execute(cur, name, query, params)
                 return cur.fetchone()[0]
     
-    def get_total_protections(self) -> int:
+    def _exec_dicts(self, name: str, query: sql.Composable) -> List[Dict[str, Any]]:
+        """Executa uma query preparada e retorna as linhas como dicionários.
+        
+        As chaves são os nomes (aliases) das colunas; as linhas são lidas em
+        lotes de ``FETCH_BATCH_SIZE`` via ``_fetchmany_iter``.
+        """
+        with self.get_connection() as conn:
+            with conn.cursor() as cur:
+                self._execute(cur, name, query)
+                cols = [d.name for d in cur.description]
+                return [dict(zip(cols, row)) for row in _fetchmany_iter(cur)]
+    
+    def _estimate_count(self, table: str) -> int:
+        """Retorna o número estimado de linhas de uma tabela (pg_class.reltuples).
+        
+        A estimativa é atualizada por ANALYZE/autovacuum e custa uma leitura de
+        catálogo, independente do tamanho da tabela.
+        
+        Args:
+            table: Nome da tabela no schema configurado
+            
+        Returns:
+            Estimativa de linhas; -1 se a tabela nunca foi analisada ou não existe.
+        """
+        estimate = self._exec_one(
+            'estimate_count',
+            sql.SQL("""
+            SELECT COALESCE((
+                SELECT reltuples::BIGINT FROM pg_class
+                WHERE relname = $1
+                  AND relnamespace = (SELECT oid FROM pg_namespace WHERE nspname = $2)
+            ), -1)
+            """),
+            (table, self.schema)
+        )
+        return -1 if estimate is None else estimate
+    
+    def _count(self, table: str, exact: bool) -> int:
+        """Conta as linhas de uma tabela, por estimativa ou COUNT(*).
+        
+        Sem estatísticas utilizáveis (tabela nunca analisada ou estimativa zero,
+        típico logo após a primeira carga) recorre ao COUNT(*) exato.
+        """
+        if not exact:
+            estimate = self._estimate_count(table)
+            if estimate > 0:
+                return estimate
+        return self._exec_one(
+            f'count_{table}',
+            sql.SQL("SELECT COUNT(*) FROM {}.{}").format(sql.Identifier(self.schema), sql.Identifier(table))
+        )
+    
+    @_ttl_cached
+    def _has_stats_cache(self) -> bool:
+        """Indica se as tabelas ``stats_cache_*`` (migração 002) existem no schema."""
+        return self._exec_one(
+            'has_stats_cache',
+            sql.SQL("SELECT to_regclass(format('%I.stats_cache_manufacturer', $1::text)) IS NOT NULL"),
+            (self.schema,)
+        )
+    
+    def _summary_sources(self) -> Dict[str, sql.Composable]:
+        """Retorna as origens (tabela ou subquery) dos resumos agregados.
+        
+        Com a migração 002 aplicada são as tabelas ``stats_cache_*``; sem ela,
+        subqueries ``GROUP BY`` sobre as tabelas base, com as mesmas colunas:
+        
+            - manufacturers: name, total_relays, total_models
+            - relay_types: relay_type, total
+            - voltage_classes: voltage_class_kv, total
+        """
+        schema = sql.Identifier(self.schema)
+        
+        if self._has_stats_cache():
+            return {
+                'manufacturers': sql.SQL("{}.stats_cache_manufacturer").format(schema),
+                'relay_types': sql.SQL("{}.stats_cache_relay_type").format(schema),
+                'voltage_classes': sql.SQL("{}.stats_cache_voltage_class").format(schema),
+            }
+        
+        return {
+            'manufacturers': sql.SQL("""(
+                SELECT
+                    m.name,
+                    COUNT(DISTINCT r.id) AS total_relays,
+                    COUNT(DISTINCT rm.id) AS total_models
+                FROM {schema}.manufacturers m
+                LEFT JOIN {schema}.relay_models rm ON m.id = rm.manufacturer_id
+                LEFT JOIN {schema}.relays r ON rm.id = r.relay_model_id
+                GROUP BY m.name
+            ) AS live_manufacturers""").format(schema=schema),
+            'relay_types': sql.SQL("""(
+                SELECT relay_type, COUNT(*) AS total
+                FROM {schema}.relays
+                WHERE relay_type IS NOT NULL
+                GROUP BY relay_type
+            ) AS live_relay_types""").format(schema=schema),
+            'voltage_classes': sql.SQL("""(
+                SELECT voltage_class_kv, COUNT(*) AS total
+                FROM {schema}.relays
+                WHERE voltage_class_kv IS NOT NULL
+                GROUP BY voltage_class_kv
+            ) AS live_voltage_classes""").format(schema=schema),
+        }
+    
+    @_ttl_cached
+    def get_total_relays(self, exact: bool = False) -> int:
+        """Retorna o número total de relés cadastrados no sistema.
+        
+        Args:
+            exact: Se True, usa COUNT(*); por padrão usa a estimativa do
+                planner (pg_class.reltuples)
+            
+        Returns:
+            Quantidade total de registros na tabela de relés.
+            
+        Raises:
+            psycopg2.Error: Em caso de erro na consulta ao banco.
+        """
+        return self._count('relays', exact)
+    
+    @_ttl_cached
+    def get_total_protections(self, exact: bool = False) -> int:
         """Retorna o número total de funções de proteção cadastradas.
         
+        Args:
+            exact: Se True, usa COUNT(*); por padrão usa a estimativa do
+                planner (pg_class.reltuples)
+            
         Returns:
             Quantidade total de registros na tabela de funções de proteção.
             
         Raises:
             psycopg2.Error: Em caso de erro na consulta ao banco.
         """
-        with self.get_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute(f"SELECT COUNT(*) FROM {self.schema}.protection_functions")
-                return cur.fetchone()[0]
+        return self._count('protection_functions', exact)
     
-    def get_total_parameters(self) -> int:
+    @_ttl_cached
+    def get_total_parameters(self, exact: bool = False) -> int:
         """Retorna o número total de parâmetros configurados no sistema.
         
+        Args:
+            exact: Se True, usa COUNT(*); por padrão usa a estimativa do
+                planner (pg_class.reltuples)
+            
         Returns:
             Quantidade total de registros na tabela de parâmetros.
             
         Raises:
             psycopg2.Error: Em caso de erro na consulta ao banco.
         """
-        with self.get_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute(f"SELECT COUNT(*) FROM {self.schema}.parameters")
-                return cur.fetchone()[0]
+        return self._count('parameters', exact)
     
+    @_ttl_cached
     def get_manufacturers_summary(self) -> List[Dict[str, Any]]:
         """Retorna resumo agregado por fabricante de relés.
         
@@ -128,30 +384,15 @@ class DatabaseStats:
         Raises:
             psycopg2.Error: Em caso de erro na consulta ao banco.
         """
-        query = f"""
-        SELECT 
-            m.name as manufacturer,
-            COUNT(DISTINCT r.id) as total_relays,
-            COUNT(DISTINCT rm.id) as total_models
-        FROM {self.schema}.manufacturers m
-        LEFT JOIN {self.schema}.relay_models rm ON m.id = rm.manufacturer_id
-        LEFT JOIN {self.schema}.relays r ON rm.id = r.relay_model_id
-        GROUP BY m.name
+        query = sql.SQL("""
+        SELECT name, total_relays, total_models
+        FROM {}
         ORDER BY total_relays DESC
-        """
+        """).format(self._summary_sources()['manufacturers'])
         
-        with self.get_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute(query)
-                results = []
-                for row in cur.fetchall():
-                    results.append({
-                        'name': row[0],
-                        'total_relays': row[1],
-                        'total_models': row[2]
-                    })
-                return results
+        return self._exec_dicts('manufacturers_summary', query)
     
+    @_ttl_cached
     def get_relay_types_summary(self) -> List[Dict[str, Any]]:
         """Retorna resumo agregado por tipo de relé.
         
@@ -166,27 +407,15 @@ class DatabaseStats:
         Raises:
             psycopg2.Error: Em caso de erro na consulta ao banco.
         """
-        query = f"""
-        SELECT 
-            relay_type,
-            COUNT(*) as total
-        FROM {self.schema}.relays
-        WHERE relay_type IS NOT NULL
-        GROUP BY relay_type
+        query = sql.SQL("""
+        SELECT relay_type AS type, total AS count
+        FROM {}
         ORDER BY total DESC
-        """
+        """).format(self._summary_sources()['relay_types'])
         
-        with self.get_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute(query)
-                results = []
-                for row in cur.fetchall():
-                    results.append({
-                        'type': row[0],
-                        'count': row[1]
-                    })
-                return results
+        return self._exec_dicts('relay_types_summary', query)
     
+    @_ttl_cached
     def get_voltage_classes_summary(self) -> List[Dict[str, Any]]:
         """Retorna resumo agregado por classe de tensão.
         
@@ -201,27 +430,15 @@ class DatabaseStats:
         Raises:
             psycopg2.Error: Em caso de erro na consulta ao banco.
         """
-        query = f"""
-        SELECT 
-            voltage_class_kv,
-            COUNT(*) as total
-        FROM {self.schema}.relays
-        WHERE voltage_class_kv IS NOT NULL
-        GROUP BY voltage_class_kv
+        query = sql.SQL("""
+        SELECT voltage_class_kv AS voltage_class, total AS count
+        FROM {}
         ORDER BY voltage_class_kv
-        """
+        """).format(self._summary_sources()['voltage_classes'])
         
-        with self.get_connection() as conn:
-            with conn.cursor() as cur:
-                cur.execute(query)
-                results = []
-                for row in cur.fetchall():
-                    results.append({
-                        'voltage_class': row[0],
-                        'count': row[1]
-                    })
-                return results
+        return self._exec_dicts('voltage_classes_summary', query)
     
+    @_ttl_cached
     def get_database_status(self) -> Dict[str, Any]:
         """Retorna status completo do banco de dados com todas as estatísticas.
         
@@ -238,32 +455,77 @@ class DatabaseStats:
                 - voltage_classes (List[Dict]): Resumo por tensão
                 - timestamp (str): Data/hora da consulta
             
+        Note:
+            Todas as métricas são obtidas em uma única query (um round-trip),
+            montada com ``json_build_object``/``json_agg``; por isso
+            ``voltage_class`` chega como número JSON (float) e não Decimal.
+            O resultado é memoizado por ``cache_ttl`` segundos; ``timestamp``
+            indica quando as métricas foram consultadas.
+            
         Raises:
             psycopg2.Error: Em caso de erro nas consultas ao banco.
         """
-        return {
-            'total_relays': self.get_total_relays(),
-            'total_protections': self.get_total_protections(),
-            'total_parameters': self.get_total_parameters(),
-            'manufacturers': self.get_manufacturers_summary(),
-            'relay_types': self.get_relay_types_summary(),
-            'voltage_classes': self.get_voltage_classes_summary(),
-            'timestamp': datetime.now().strftime('%d/%m/%Y %H:%M:%S')
-        }
+        query = sql.SQL("""
+        SELECT json_build_object(
+            'total_relays', (SELECT COUNT(*) FROM {schema}.relays),
+            'total_protections', (SELECT COUNT(*) FROM {schema}.protection_functions),
+            'total_parameters', (SELECT COUNT(*) FROM {schema}.parameters),
+            'manufacturers', (
+                SELECT COALESCE(json_agg(json_build_object(
+                    'name', name,
+                    'total_relays', total_relays,
+                    'total_models', total_models
+                ) ORDER BY total_relays DESC), '[]'::json)
+                FROM {manufacturers}
+            ),
+            'relay_types', (
+                SELECT COALESCE(json_agg(json_build_object(
+                    'type', relay_type,
+                    'count', total
+                ) ORDER BY total DESC), '[]'::json)
+                FROM {relay_types}
+            ),
+            'voltage_classes', (
+                SELECT COALESCE(json_agg(json_build_object(
+                    'voltage_class', voltage_class_kv,
+                    'count', total
+                ) ORDER BY voltage_class_kv), '[]'::json)
+                FROM {voltage_classes}
+            )
+        )
+        """).format(schema=sql.Identifier(self.schema), **self._summary_sources())
+        
+        status = self._exec_one('database_status', query)
+        status['timestamp'] = datetime.now().strftime('%d/%m/%Y %H:%M:%S')
+        return status
+    
+    def invalidate(self) -> None:
+        """Descarta as estatísticas memoizadas (usar após cargas/alterações no banco)."""
+        self._cache.clear()
     
     def check_connection(self) -> bool:
         """Verifica se a conexão com o banco de dados está disponível.
         
         Tenta executar uma query simples para validar conectividade e
-        disponibilidade do servidor PostgreSQL.
+        disponibilidade do servidor PostgreSQL. Um sucesso vale por
+        ``self._check_ttl`` segundos, durante os quais a verificação não
+        toca o banco; falhas não são memorizadas.
         
         Returns:
             True se conexão estabelecida com sucesso, False caso contrário.
         """
+        if self._last_ok_ts is not None and time.monotonic() - self._last_ok_ts < self._check_ttl:
+            return True
+        
         try:
             with self.get_connection() as conn:
                 with conn.cursor() as cur:
                     cur.execute("SELECT 1")
-                    return True
+            self._last_ok_ts = time.monotonic()
+            return True
         except Exception:
+            self._last_ok_ts = None
             return False
+
+
+atexit.register(DatabaseStats.close_pools)
@@ -4,57 +4,297 @@ Handles file operations, hashing, and registry management
 """
 
 import os
-import json
+import mmap
 import hashlib
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
+from itertools import repeat
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from .json_io import json_loads, json_dumps
+
+try:
+    import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+# Registry key algorithm for new registries; "blake3" (SIMD, multi-threaded) is opt-in
+# because the blake3 package is not a declared dependency
+DEFAULT_HASH_ALGORITHM = "sha256"
+
+# Read size for the SHA256 fallback loop (1 MiB, reused buffer)
+HASH_CHUNK_SIZE = 1 << 20
+
+# Journal lines accumulated before the registry is compacted into the JSON snapshot
+COMPACT_EVERY = 1000
+
+# Entries kept by the get_file_info LRU cache
+FILE_INFO_CACHE_SIZE = 4096
+
+# Entries kept by the file hash LRU cache
+HASH_CACHE_SIZE = 4096
+
+
+def _sha256_file(file_path: str) -> str:
+    """SHA256 of a file: hashlib.file_digest, or a 1 MiB readinto loop"""
+    with open(file_path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):
+            # Python 3.11+: buffered read loop implemented in C
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        
+        sha256_hash = hashlib.sha256()
+        buf = bytearray(HASH_CHUNK_SIZE)
+        view = memoryview(buf)
+        while n := f.readinto(buf):
+            sha256_hash.update(view[:n])
+    return sha256_hash.hexdigest()
+
+
+def _blake3_file(file_path: str, size: int) -> str:
+    """BLAKE3 of a file over a read-only mmap"""
+    if size == 0:
+        return blake3.blake3(b"").hexdigest()
+    with open(file_path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return blake3.blake3(mm, max_threads=blake3.blake3.AUTO).hexdigest()
+
+
+def _hash_one(file_path: str, algorithm: str) -> str:
+    """Pool worker for FileManager.hash_files (module level so it can be pickled)"""
+    if algorithm == "blake3":
+        return _blake3_file(file_path, os.path.getsize(file_path))
+    return _sha256_file(file_path)
 
 
 class FileManager:
-    """Manages file operations and processing registry"""
+    """
+    Manages file operations and processing registry
     
-    def __init__(self, registry_path: str):
+    The registry is a JSON snapshot (registry_path) plus an append-only JSONL
+    journal next to it (<stem>.jsonl). Each mark appends one journal line;
+    compact() folds the journal into the snapshot.
+    """
+    
+    def __init__(self, registry_path: str, hash_algorithm: str = DEFAULT_HASH_ALGORITHM):
+        """
+        Args:
+            registry_path: JSON snapshot of the processing registry
+            hash_algorithm: Key algorithm ("sha256" or "blake3") for a new registry;
+                an existing registry keeps the algorithm recorded in it
+        """
         self.registry_path = Path(registry_path)
         self.registry_path.parent.mkdir(parents=True, exist_ok=True)
-        self.registry = self._load_registry()
+        self.journal_path = self.registry_path.with_name(f"{self.registry_path.stem}.jsonl")
+        self._journal_lines = 0
+        self._journal_needs_newline = False
+        # (absolute path, algorithm) -> (size, mtime_ns, hash), least recently used first,
+        # so check-then-mark hashes once; a size/mtime change replaces the entry
+        self._hash_cache: "OrderedDict[Tuple[str, str], Tuple[int, int, str]]" = OrderedDict()
+        # absolute path -> (size, mtime_ns, get_file_info result), least recently used first
+        self._file_info_cache: "OrderedDict[str, Tuple[int, int, Dict[str, Any]]]" = OrderedDict()
+        self.registry = self._load_registry(hash_algorithm)
+        self.hash_algorithm = self.registry["hash_algorithm"]
+        if self.hash_algorithm == "blake3" and not BLAKE3_AVAILABLE:
+            raise RuntimeError(
+                f"Registry {self.registry_path} is keyed by BLAKE3 hashes; install blake3 to read it"
+            )
     
-    def _load_registry(self) -> Dict[str, Any]:
-        """Load processing registry from JSON file"""
+    def _load_registry(self, hash_algorithm: str) -> Dict[str, Any]:
+        """Load processing registry from the JSON snapshot and replay the journal"""
+        registry = {"processed_files": {}, "last_updated": None}
         if self.registry_path.exists():
-            with open(self.registry_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        return {"processed_files": {}, "last_updated": None}
+            registry = json_loads(self.registry_path.read_bytes())
+            # Snapshots written before the setting was recorded hold SHA256 keys
+            registry.setdefault("hash_algorithm", "sha256")
+        
+        processed = registry["processed_files"]
+        if self.journal_path.exists():
+            with open(self.journal_path, 'rb') as f:
+                for line in f:
+                    self._journal_needs_newline = not line.endswith(b"\n")
+                    try:
+                        record = json_loads(line)
+                    except ValueError:
+                        # Line cut short by a crash mid-append
+                        continue
+                    if record.get("entry") is None:
+                        processed.pop(record["hash"], None)
+                    else:
+                        processed[record["hash"]] = record["entry"]
+                    registry["last_updated"] = record.get("at", registry["last_updated"])
+                    self._journal_lines += 1
+        
+        if "hash_algorithm" not in registry:
+            # No snapshot yet: algorithm of the journaled entries, else the configured one
+            registry["hash_algorithm"] = next(
+                (entry.get("algo", "sha256") for entry in processed.values()), hash_algorithm
+            )
+        
+        return registry
+    
+    def _append_journal(self, file_hash: str, entry: Optional[Dict[str, Any]]):
+        """Append one registry change (entry=None removes the hash); O(1) per call"""
+        self._append_journal_many([(file_hash, entry)])
+    
+    def _append_journal_many(self, changes: List[Tuple[str, Optional[Dict[str, Any]]]]):
+        """Append several registry changes with a single open/write of the journal"""
+        if not changes:
+            return
+        now = datetime.now().isoformat()
+        self.registry["last_updated"] = now
+        lines = b"".join(
+            json_dumps({"hash": file_hash, "entry": entry, "at": now}) + b"\n"
+            for file_hash, entry in changes
+        )
+        with open(self.journal_path, 'ab') as f:
+            if self._journal_needs_newline:
+                # Terminate a partial last line so this record starts on its own line
+                f.write(b"\n")
+                self._journal_needs_newline = False
+            f.write(lines)
+        
+        self._journal_lines += len(changes)
+        if self._journal_lines >= COMPACT_EVERY:
+            self.compact()
     
     def _save_registry(self):
-        """Save processing registry to JSON file"""
+        """Save the full registry to the JSON snapshot atomically (temp file + os.replace)"""
         self.registry["last_updated"] = datetime.now().isoformat()
-        with open(self.registry_path, 'w', encoding='utf-8') as f:
-            json.dump(self.registry, f, indent=2, ensure_ascii=False)
+        tmp_path = self.registry_path.with_name(f"{self.registry_path.name}.tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(json_dumps(self.registry, indent=True))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.registry_path)
     
-    def calculate_file_hash(self, file_path: str) -> str:
-        """Calculate SHA256 hash of file"""
-        sha256_hash = hashlib.sha256()
-        with open(file_path, "rb") as f:
-            for byte_block in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(byte_block)
-        return sha256_hash.hexdigest()
+    def compact(self):
+        """Fold the journal into the JSON snapshot and start a new, empty journal"""
+        self._save_registry()
+        # A crash before this point only leaves journal lines that replay idempotently
+        if self.journal_path.exists():
+            self.journal_path.unlink()
+        self._journal_lines = 0
+        self._journal_needs_newline = False
+    
+    def calculate_file_hash(self, file_path: str, algorithm: Optional[str] = None) -> str:
+        """Calculate file hash (BLAKE3 or SHA256), reusing it while size and mtime are unchanged"""
+        algorithm = algorithm or self.hash_algorithm
+        stat = os.stat(file_path)
+        key = (os.path.abspath(file_path), algorithm)
+        
+        file_hash = self._cached_hash(key, stat)
+        if file_hash is None:
+            if algorithm == "blake3":
+                file_hash = self._compute_blake3(file_path, stat.st_size)
+            else:
+                file_hash = self._compute_file_hash(file_path)
+            self._store_hash(key, stat, file_hash)
+        return file_hash
+    
+    def _cached_hash(self, key: Tuple[str, str], stat: os.stat_result) -> Optional[str]:
+        """Cached hash for (path, algorithm) if size and mtime still match, else None"""
+        cached = self._hash_cache.get(key)
+        if cached is None or cached[0] != stat.st_size or cached[1] != stat.st_mtime_ns:
+            return None
+        self._hash_cache.move_to_end(key)
+        return cached[2]
+    
+    def _store_hash(self, key: Tuple[str, str], stat: os.stat_result, file_hash: str):
+        """Cache a hash, evicting the least recently used entry past HASH_CACHE_SIZE"""
+        self._hash_cache[key] = (stat.st_size, stat.st_mtime_ns, file_hash)
+        self._hash_cache.move_to_end(key)
+        if len(self._hash_cache) > HASH_CACHE_SIZE:
+            self._hash_cache.popitem(last=False)
+    
+    def _compute_blake3(self, file_path: str, size: int) -> str:
+        """Hash the file with BLAKE3 over a read-only mmap (no Python read loop)"""
+        return _blake3_file(file_path, size)
+    
+    def _compute_file_hash(self, file_path: str) -> str:
+        """Read the file and compute its SHA256 hash"""
+        return _sha256_file(file_path)
+    
+    def hash_files(self, paths: List[str], algorithm: Optional[str] = None,
+                   use_threads: bool = False) -> Dict[str, str]:
+        """
+        Hash many files concurrently
+        
+        Files whose hash is already cached are not re-read; the rest are hashed
+        in a ProcessPoolExecutor (CPU-bound SHA256 escapes the GIL), or in a
+        ThreadPoolExecutor with use_threads=True when I/O overlap dominates
+        (fast SSDs; hashlib and blake3 release the GIL on large buffers).
+        
+        Returns:
+            Mapping of each path (as given) to its hex digest
+        """
+        algorithm = algorithm or self.hash_algorithm
+        results: Dict[str, str] = {}
+        pending: List[Tuple[str, Tuple[str, str], os.stat_result]] = []
+        for file_path in paths:
+            stat = os.stat(file_path)
+            key = (os.path.abspath(file_path), algorithm)
+            file_hash = self._cached_hash(key, stat)
+            if file_hash is None:
+                pending.append((file_path, key, stat))
+            else:
+                results[file_path] = file_hash
+        
+        if len(pending) > 1:
+            executor_cls = ThreadPoolExecutor if use_threads else ProcessPoolExecutor
+            with executor_cls(max_workers=os.cpu_count()) as ex:
+                hashes = list(ex.map(_hash_one, [p for p, _, _ in pending],
+                                     repeat(algorithm), chunksize=8))
+        else:
+            hashes = [_hash_one(p, algorithm) for p, _, _ in pending]
+        
+        for (file_path, key, stat), file_hash in zip(pending, hashes):
+            self._store_hash(key, stat, file_hash)
+            results[file_path] = file_hash
+        return results
     
     def is_file_processed(self, file_path: str) -> bool:
         """Check if file was already processed"""
-        file_hash = self.calculate_file_hash(file_path)
-        return file_hash in self.registry["processed_files"]
+        return self.calculate_file_hash(file_path) in self.registry["processed_files"]
     
-    def mark_file_processed(self, file_path: str, metadata: Optional[Dict[str, Any]] = None):
-        """Mark file as processed in registry"""
-        file_hash = self.calculate_file_hash(file_path)
-        self.registry["processed_files"][file_hash] = {
+    def _processed_entry(self, file_path: str, metadata: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Build the registry entry for a processed file"""
+        return {
             "file_path": str(file_path),
             "file_name": Path(file_path).name,
             "processed_at": datetime.now().isoformat(),
+            "algo": self.hash_algorithm,
             "metadata": metadata or {}
         }
-        self._save_registry()
+    
+    def mark_file_processed(self, file_path: str, metadata: Optional[Dict[str, Any]] = None):
+        """Mark file as processed in registry"""
+        file_hash = self.calculate_file_hash(file_path)
+        entry = self._processed_entry(file_path, metadata)
+        self.registry["processed_files"][file_hash] = entry
+        self._append_journal(file_hash, entry)
+    
+    def mark_files_processed(self, paths: List[str],
+                             metadata_per: Optional[Dict[str, Dict[str, Any]]] = None):
+        """
+        Mark several files as processed with a single registry write
+        
+        Args:
+            paths: Files to mark
+            metadata_per: Optional metadata keyed by file path (as given in paths)
+        """
+        metadata_per = metadata_per or {}
+        hashes = self.hash_files(paths)
+        changes = []
+        for file_path in paths:
+            file_hash = hashes[file_path]
+            entry = self._processed_entry(file_path, metadata_per.get(file_path))
+            self.registry["processed_files"][file_hash] = entry
+            changes.append((file_hash, entry))
+        
+        self._append_journal_many(changes)
     
     def get_files_by_extension(self, directory: str, extension: str) -> List[Path]:
         """Get all files with specific extension from directory"""
@@ -62,8 +302,14 @@ class FileManager:
         if not directory_path.exists():
             return []
         
-        pattern = f"**/*{extension}" if not extension.startswith('*') else f"**/{extension}"
-        return list(directory_path.glob(pattern))
+        # os.walk classifies entries from the dirent type; pathlib's ** recursion stats each one
+        suffix = extension.lstrip('*')
+        return [
+            Path(root, name)
+            for root, _dirs, files in os.walk(directory_path)
+            for name in files
+            if name.endswith(suffix)
+        ]
     
     def get_pdf_files(self, directory: str) -> List[Path]:
         """Get all PDF files from directory"""
@@ -80,22 +326,39 @@ class FileManager:
     def get_file_info(self, file_path: str) -> Dict[str, Any]:
         """Get file information"""
         path = Path(file_path)
-        if not path.exists():
+        try:
+            stat = path.stat()
+        except OSError:
             return {}
         
-        stat = path.stat()
-        return {
+        # One entry per path (LRU order); a size/mtime change replaces it
+        abs_path = str(path.absolute())
+        cached = self._file_info_cache.get(abs_path)
+        if cached is not None and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+            self._file_info_cache.move_to_end(abs_path)
+            return dict(cached[2])
+        
+        info = {
             "name": path.name,
-            "path": str(path.absolute()),
+            "path": abs_path,
             "size_bytes": stat.st_size,
             "size_kb": round(stat.st_size / 1024, 2),
             "modified": datetime.fromtimestamp(stat.st_mtime).isoformat(),
             "extension": path.suffix,
             "hash": self.calculate_file_hash(file_path)
         }
+        self._file_info_cache[abs_path] = (stat.st_size, stat.st_mtime_ns, info)
+        self._file_info_cache.move_to_end(abs_path)
+        if len(self._file_info_cache) > FILE_INFO_CACHE_SIZE:
+            self._file_info_cache.popitem(last=False)
+        return dict(info)
     
     def backup_registry(self):
         """Create backup of registry file"""
+        if self.journal_path.exists():
+            # Back up a complete snapshot, not one missing the journaled marks
+            self.compact()
+        
         if self.registry_path.exists():
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             backup_path = self.registry_path.parent / f"{self.registry_path.stem}_backup_{timestamp}.json"
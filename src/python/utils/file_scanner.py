@@ -5,7 +5,10 @@ manter registro de arquivos já processados e gerenciar o ciclo de vida do proce
 de documentos de configuração de relés.
 
 O registro de arquivos processados é mantido em formato JSON, permitindo rastreamento
-persistente entre execuções do sistema.
+persistente entre execuções do sistema. É um arquivo próprio do scanner (nomes de
+PDFs), separado do registro por hash do FileManager (``processed_files.json``). Novas marcações são acrescentadas a um
+journal NDJSON (mesmo nome, sufixo .ndjson) e consolidadas no JSON periodicamente
+por ``compact_registry()``.
 
 Exemplo:
     >>> from src.python.utils.file_scanner import FileScanner
@@ -18,12 +21,26 @@ Attributes:
     registry_file (Path): Arquivo JSON com registro de processamento
 """
 
-import json
+import os
 from pathlib import Path
-from typing import List, Dict, Set, Optional, Any
+from typing import List, Dict, Set, Optional, Any, Tuple
 from datetime import datetime
 import shutil
 
+from .json_io import json_loads, json_dumps
+
+# Linhas acumuladas no journal antes de consolidá-lo no snapshot JSON
+JOURNAL_COMPACT_EVERY = 500
+
+
+def _stat_signature(path: Path) -> Optional[Tuple[int, int]]:
+    """Retorna (mtime_ns, tamanho) do arquivo, ou None se ele não existir."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
 
 class FileScanner:
     """Gerenciador de escaneamento e rastreamento de arquivos PDF.
@@ -40,7 +57,7 @@ class FileScanner:
     def __init__(
         self,
         pdf_dir: str = 'inputs/pdf',
-        registry_file: str = 'inputs/registry/processed_files.json'
+        registry_file: str = 'inputs/registry/processed_pdfs.json'
     ) -> None:
         """Inicializa o scanner de arquivos PDF.
         
@@ -49,10 +66,22 @@ class FileScanner:
         
         Args:
             pdf_dir: Caminho do diretório contendo os arquivos PDF (padrão: 'inputs/pdf')
-            registry_file: Caminho do arquivo de registro JSON (padrão: 'inputs/registry/processed_files.json')
+            registry_file: Caminho do arquivo de registro JSON (padrão: 'inputs/registry/processed_pdfs.json')
         """
         self.pdf_dir = Path(pdf_dir)
         self.registry_file = Path(registry_file)
+        # Caminho absoluto do diretório calculado uma vez (absolute() consulta o cwd a cada chamada)
+        self._abs_prefix = self.pdf_dir.absolute()
+        
+        self.journal_file = self.registry_file.with_suffix('.ndjson')
+        self._journal_lines = 0
+        self._journal_needs_newline = False
+        
+        # (assinatura do snapshot, assinatura do journal, conjunto de processados);
+        # assinatura = (mtime_ns, tamanho), válida enquanto nenhum dos dois arquivos mudar
+        self._registry_cache: Optional[
+            Tuple[Optional[Tuple[int, int]], Optional[Tuple[int, int]], Set[str]]
+        ] = None
         
         # Criar diretórios se não existirem
         self.pdf_dir.mkdir(parents=True, exist_ok=True)
@@ -68,34 +97,81 @@ class FileScanner:
             Lista ordenada de objetos Path representando os arquivos PDF encontrados.
             Retorna lista vazia se o diretório não existir.
         """
-        if not self.pdf_dir.exists():
+        # os.scandir reaproveita o tipo da entrada de diretório (sem stat extra por arquivo)
+        # Ordena pelo nome (str) antes de criar os Path, evitando comparações entre objetos Path
+        try:
+            with os.scandir(self.pdf_dir) as it:
+                entries = [
+                    (entry.name, entry.path) for entry in it
+                    if entry.name.lower().endswith('.pdf') and entry.is_file()
+                ]
+        except FileNotFoundError:
             return []
-        
-        return sorted([
-            f for f in self.pdf_dir.glob('*.pdf')
-            if f.is_file()
-        ])
+        entries.sort()
+        return [Path(path) for _, path in entries]
     
     def get_processed_files(self) -> Set[str]:
         """Retorna conjunto de nomes de arquivos já processados pelo sistema.
         
-        Lê o arquivo de registro JSON e extrai os nomes dos arquivos que já
-        foram processados anteriormente. Retorna conjunto vazio em caso de
-        arquivo inexistente ou erro de leitura.
+        Lê o snapshot JSON e o journal NDJSON e extrai os nomes dos arquivos
+        que já foram processados anteriormente. Retorna conjunto vazio em caso
+        de registro inexistente ou ilegível.
+        
+        O conjunto fica em cache e só é relido quando o ``mtime_ns`` ou o
+        tamanho do snapshot ou do journal mudam (um stat de cada por consulta).
         
         Returns:
             Conjunto (set) contendo nomes dos arquivos já processados.
             Retorna conjunto vazio se registro não existir ou estiver corrompido.
+            O conjunto retornado é compartilhado com o cache e não deve ser alterado.
         """
-        if not self.registry_file.exists():
-            return set()
+        snapshot_sig = _stat_signature(self.registry_file)
+        journal_sig = _stat_signature(self.journal_file)
+        cache = self._registry_cache
+        if cache is not None and cache[0] == snapshot_sig and cache[1] == journal_sig:
+            return cache[2]
+        
+        processed: Set[str] = set()
+        if snapshot_sig is not None:
+            try:
+                # Sem variáveis intermediárias: os bytes e o documento são liberados
+                # assim que o conjunto é montado
+                processed = set(
+                    json_loads(self.registry_file.read_bytes()).get('processed_files', [])
+                )
+            except (ValueError, IOError):
+                processed = set()
+        self._read_journal(processed)
+        
+        self._registry_cache = (snapshot_sig, journal_sig, processed)
+        return processed
+    
+    def _read_journal(self, names: Set[str]) -> None:
+        """Acrescenta ao conjunto os nomes registrados no journal NDJSON.
         
+        O journal é lido linha a linha direto no conjunto recebido, sem
+        coleções intermediárias. Linhas inválidas (por exemplo, cortadas por
+        uma queda no meio da escrita) são ignoradas. Atualiza a contagem de
+        linhas usada para decidir a consolidação.
+        
+        Args:
+            names: Conjunto que recebe os nomes (tipicamente o do snapshot).
+        """
+        self._journal_lines = 0
+        self._journal_needs_newline = False
         try:
-            with open(self.registry_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return set(data.get('processed_files', []))
-        except (json.JSONDecodeError, IOError):
-            return set()
+            f = open(self.journal_file, 'rb')
+        except OSError:
+            return
+        
+        with f:
+            for line in f:
+                self._journal_needs_newline = not line.endswith(b'\n')
+                try:
+                    names.add(json_loads(line)['name'])
+                except (ValueError, KeyError, TypeError):
+                    continue
+                self._journal_lines += 1
     
     def get_unprocessed_pdfs(self) -> List[Path]:
         """Identifica arquivos PDF que ainda não foram processados.
@@ -126,16 +202,83 @@ class FileScanner:
         Raises:
             IOError: Se houver erro ao escrever no arquivo de registro.
         """
+        self.mark_many_as_processed([pdf_file])
+    
+    def mark_many_as_processed(self, pdfs: List[Path]) -> None:
+        """Registra vários arquivos PDF como processados em uma única escrita.
+        
+        Acrescenta uma linha por arquivo ao journal NDJSON com uma única
+        escrita (O(1) por arquivo, sem reescrever o registro inteiro). A cada
+        ``JOURNAL_COMPACT_EVERY`` linhas o journal é consolidado no JSON.
+        
+        Args:
+            pdfs: Lista de objetos Path dos arquivos a serem marcados.
+            
+        Raises:
+            IOError: Se houver erro ao escrever no arquivo de registro.
+        """
+        if not pdfs:
+            return
+        
+        # Valida o cache (e a contagem de linhas do journal) antes de escrever
         processed = self.get_processed_files()
-        processed.add(pdf_file.name)
         
+        now = datetime.now().isoformat()
+        lines = b''.join(json_dumps({'name': pdf.name, 'ts': now}) + b'\n' for pdf in pdfs)
+        with open(self.journal_file, 'ab') as f:
+            if self._journal_needs_newline:
+                # Termina uma última linha incompleta antes de acrescentar
+                f.write(b'\n')
+                self._journal_needs_newline = False
+            f.write(lines)
+        self._journal_lines += len(pdfs)
+        
+        # Atualiza o cache em vez de forçar uma releitura na próxima consulta
+        processed.update(pdf.name for pdf in pdfs)
+        self._registry_cache = (
+            self._registry_cache[0], _stat_signature(self.journal_file), processed
+        )
+        
+        if self._journal_lines >= JOURNAL_COMPACT_EVERY:
+            self.compact_registry()
+    
+    def compact_registry(self) -> None:
+        """Consolida o journal NDJSON no snapshot JSON e remove o journal.
+        
+        Reescreve o registro JSON com a lista ordenada de todos os arquivos
+        processados.
+        
+        Raises:
+            IOError: Se houver erro ao escrever no arquivo de registro.
+        """
+        processed = self.get_processed_files()
         data = {
-            'processed_files': sorted(list(processed)),
+            'processed_files': sorted(processed),
             'last_update': datetime.now().isoformat()
         }
+        self._write_snapshot_atomic(json_dumps(data, indent=True))
         
-        with open(self.registry_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        # Uma queda aqui só deixa linhas já incluídas no snapshot (reaplicá-las é idempotente)
+        self.journal_file.unlink(missing_ok=True)
+        self._journal_lines = 0
+        self._journal_needs_newline = False
+        self._registry_cache = (_stat_signature(self.registry_file), None, processed)
+    
+    def _write_snapshot_atomic(self, payload: bytes) -> None:
+        """Grava o snapshot JSON de forma atômica (arquivo temporário + os.replace).
+        
+        Uma queda no meio da escrita deixa o snapshot anterior intacto, em vez
+        de um arquivo truncado.
+        
+        Args:
+            payload: Conteúdo JSON já serializado, escrito com um único write.
+        """
+        tmp = self.registry_file.with_name(f'{self.registry_file.name}.tmp')
+        with open(tmp, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.registry_file)
     
     def get_scan_summary(self) -> Dict[str, Any]:
         """Retorna resumo estatístico do escaneamento de arquivos.
@@ -151,16 +294,17 @@ class FileScanner:
                 - unprocessed_files (List[str]): Nomes dos arquivos pendentes
                 - pdf_directory (str): Caminho absoluto do diretório de PDFs
         """
+        # Uma varredura do diretório e uma leitura do registro para o resumo inteiro
         all_pdfs = self.get_all_pdfs()
-        unprocessed = self.get_unprocessed_pdfs()
         processed = self.get_processed_files()
+        unprocessed = [pdf for pdf in all_pdfs if pdf.name not in processed]
         
         return {
             'total_pdfs': len(all_pdfs),
             'processed_count': len(processed),
             'unprocessed_count': len(unprocessed),
             'unprocessed_files': [pdf.name for pdf in unprocessed],
-            'pdf_directory': str(self.pdf_dir.absolute())
+            'pdf_directory': str(self._abs_prefix)
         }
     
     def get_pdf_info(self, pdf_file: Path) -> Dict[str, Any]:
@@ -184,13 +328,17 @@ class FileScanner:
             OSError: Se houver erro ao acessar as propriedades do arquivo.
         """
         stats = pdf_file.stat()
+        if pdf_file.parent == self.pdf_dir:
+            abs_path = self._abs_prefix / pdf_file.name
+        else:
+            abs_path = pdf_file.absolute()
         
         return {
             'name': pdf_file.name,
             'size_bytes': stats.st_size,
             'size_mb': round(stats.st_size / (1024 * 1024), 2),
             'modified': datetime.fromtimestamp(stats.st_mtime).strftime('%d/%m/%Y %H:%M'),
-            'path': str(pdf_file.absolute())
+            'path': str(abs_path)
         }
     
     def clear_registry(self) -> None:
@@ -204,8 +352,11 @@ class FileScanner:
             Esta operação é irreversível. Considere usar backup_registry()
             antes de executar este método.
         """
-        if self.registry_file.exists():
-            self.registry_file.unlink()
+        self.registry_file.unlink(missing_ok=True)
+        self.journal_file.unlink(missing_ok=True)
+        self._journal_lines = 0
+        self._journal_needs_newline = False
+        self._registry_cache = None
     
     def backup_registry(self) -> Optional[Path]:
         """Cria cópia de segurança do arquivo de registro atual.
@@ -225,12 +376,17 @@ class FileScanner:
             >>> backup_path = scanner.backup_registry()
             >>> print(f"Backup criado em: {backup_path}")
         """
-        if not self.registry_file.exists():
-            return None
-        
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        
+        # O backup deve conter também as marcações que ainda estão no journal
+        if self.journal_file.exists():
+            self.compact_registry()
+        
         backup_file = self.registry_file.parent / f'backup_{timestamp}.json'
         
-        shutil.copy2(self.registry_file, backup_file)
+        try:
+            shutil.copy2(self.registry_file, backup_file)
+        except FileNotFoundError:
+            return None
         
         return backup_file
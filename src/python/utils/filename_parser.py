@@ -4,8 +4,22 @@ Extrai informações estruturadas dos nomes de arquivos de relés
 """
 
 import re
+from functools import lru_cache
 from typing import Dict, Any, Optional
-from datetime import datetime
+from datetime import date, datetime
+
+# Known relay models by manufacturer (P### number)
+_GE_MODELS = frozenset({143, 241, 242, 243, 441, 442, 443, 542, 543, 544, 545})
+_SCHNEIDER_MODELS = frozenset({122, 123, 125, 127, 220, 221, 222, 223, 225, 922, 923})
+
+
+@lru_cache(maxsize=1024)
+def _parse_date(data_str: str) -> Optional[date]:
+    """Parse YYYY-MM-DD (None if invalid); batches share few distinct dates, so cache them"""
+    try:
+        return datetime.strptime(data_str, '%Y-%m-%d').date()
+    except ValueError:
+        return None
 
 
 class FilenameParser:
@@ -18,26 +32,32 @@ class FilenameParser:
     """
     
     # Padrão SEPAM: 00-MF-12_2016-03-31.S40
-    SEPAM_PATTERN = r'^(\d+)-([A-Z]{2,})-(\w+)_(\d{4}-\d{2}-\d{2})\.S40$'
+    SEPAM_RE = re.compile(r'^(\d+)-([A-Z]{2,})-(\w+)_(\d{4}-\d{2}-\d{2})\.S40$', re.IGNORECASE)
     
-    # Padrão PDF com data: P###_##-XX-####_YYYY-MM-DD.pdf ou P_### ##-XX-####_YYYY-MM-DD.pdf
-    PDF_WITH_DATE_PATTERN = r'^P_?(\d{3})[\s_](\d+)-([A-Z]{2})-(\w+)_(\d{4}-\d{2}-\d{2})\.pdf$'
+    # Padrão PDF com data opcional (um único match):
+    # P###_##-XX-####_YYYY-MM-DD.pdf, P_### ##-XX-####_YYYY-MM-DD.pdf ou P### ##-XX-####.pdf
+    PDF_COMBINED_RE = re.compile(
+        r'^P_?(\d{3})[\s_](\d+)-([A-Z]{2})-(\w+)(?:_(\d{4}-\d{2}-\d{2}))?\.pdf$', re.IGNORECASE
+    )
     
-    # Padrão PDF sem data: P### ##-XX-####.pdf
-    PDF_NO_DATE_PATTERN = r'^P_?(\d{3})[\s_](\d+)-([A-Z]{2})-(\w+)\.pdf$'
+    # Parsed filenames kept per instance by parse()
+    PARSE_CACHE_SIZE = 4096
+    
+    # Shared by all instances (read-only)
+    TIPO_PAINEL_MAP = {
+        'MF': 'Main Feeder (Alimentador Principal)',
+        'MK': 'Main Coupling (Acoplamento Principal)',
+        'MP': 'Main Protection (Proteção Principal)',
+        'TR': 'Transformer (Transformador)',
+        'GN': 'Generator (Gerador)',
+        'MT': 'Motor',
+        'BU': 'Bus (Barramento)',
+        'PT': 'Potential Transformer (TP)',
+        'CT': 'Current Transformer (TC)'
+    }
     
     def __init__(self):
-        self.tipo_painel_map = {
-            'MF': 'Main Feeder (Alimentador Principal)',
-            'MK': 'Main Coupling (Acoplamento Principal)',
-            'MP': 'Main Protection (Proteção Principal)',
-            'TR': 'Transformer (Transformador)',
-            'GN': 'Generator (Gerador)',
-            'MT': 'Motor',
-            'BU': 'Bus (Barramento)',
-            'PT': 'Potential Transformer (TP)',
-            'CT': 'Current Transformer (TC)'
-        }
+        self._parse_cached = lru_cache(maxsize=self.PARSE_CACHE_SIZE)(self._parse_uncached)
     
     def parse_sepam_filename(self, filename: str) -> Dict[str, Any]:
         """
@@ -49,24 +69,20 @@ class FilenameParser:
         - 12: Identificador das barras
         - 2016-03-31: Data de configuração
         """
-        match = re.match(self.SEPAM_PATTERN, filename, re.IGNORECASE)
+        match = self.SEPAM_RE.match(filename)
         
         if not match:
             return {'valid': False, 'error': 'Filename does not match SEPAM pattern'}
         
         subestacao, tipo_painel_code, barras, data_str = match.groups()
-        
-        try:
-            data_config = datetime.strptime(data_str, '%Y-%m-%d').date()
-        except ValueError:
-            data_config = None
+        data_config = _parse_date(data_str)
         
         return {
             'valid': True,
             'tipo_arquivo': 'SEPAM_S40',
             'subestacao_codigo': subestacao,
             'tipo_painel_codigo': tipo_painel_code,
-            'tipo_painel_descricao': self.tipo_painel_map.get(tipo_painel_code, tipo_painel_code),
+            'tipo_painel_descricao': self.TIPO_PAINEL_MAP.get(tipo_painel_code, tipo_painel_code),
             'barras_identificador': barras,
             'data_configuracao': data_config,
             'fabricante': 'SCHNEIDER ELECTRIC'
@@ -87,27 +103,13 @@ class FilenameParser:
         - ####: Identificador das barras
         - YYYY-MM-DD: Data de configuração (opcional)
         """
-        # Tentar padrão com data primeiro
-        match = re.match(self.PDF_WITH_DATE_PATTERN, filename, re.IGNORECASE)
-        has_date = True
-        
-        if not match:
-            # Tentar padrão sem data
-            match = re.match(self.PDF_NO_DATE_PATTERN, filename, re.IGNORECASE)
-            has_date = False
+        match = self.PDF_COMBINED_RE.match(filename)
         
         if not match:
             return {'valid': False, 'error': f'Filename does not match PDF patterns: {filename}'}
         
-        if has_date:
-            modelo, ansi_code, tipo_painel_code, barras, data_str = match.groups()
-            try:
-                data_config = datetime.strptime(data_str, '%Y-%m-%d').date()
-            except ValueError:
-                data_config = None
-        else:
-            modelo, ansi_code, tipo_painel_code, barras = match.groups()
-            data_config = None
+        modelo, ansi_code, tipo_painel_code, barras, data_str = match.groups()
+        data_config = _parse_date(data_str) if data_str is not None else None
         
         # Determinar fabricante baseado no modelo
         fabricante = self._detect_manufacturer_from_model(modelo)
@@ -118,7 +120,7 @@ class FilenameParser:
             'modelo_rele': f'P{modelo}',
             'ansi_codigo': ansi_code,
             'tipo_painel_codigo': tipo_painel_code,
-            'tipo_painel_descricao': self.tipo_painel_map.get(tipo_painel_code, tipo_painel_code),
+            'tipo_painel_descricao': self.TIPO_PAINEL_MAP.get(tipo_painel_code, tipo_painel_code),
             'barras_identificador': barras,
             'data_configuracao': data_config,
             'fabricante': fabricante
@@ -134,11 +136,11 @@ class FilenameParser:
         modelo_num = int(modelo)
         
         # GE MiCOM patterns
-        if modelo_num in [143, 241, 242, 243, 441, 442, 443, 542, 543, 544, 545]:
+        if modelo_num in _GE_MODELS:
             return 'GENERAL ELECTRIC'
         
         # Schneider Easergy patterns
-        if modelo_num in [122, 123, 125, 127, 220, 221, 222, 223, 225, 922, 923]:
+        if modelo_num in _SCHNEIDER_MODELS:
             return 'SCHNEIDER ELECTRIC'
         
         # Default: tentar detectar por faixa
@@ -150,7 +152,14 @@ class FilenameParser:
     def parse(self, filename: str) -> Dict[str, Any]:
         """
         Parse automático baseado na extensão do arquivo
+        
+        Results are memoized per instance (batches re-parse the same names);
+        each call returns its own copy of the cached dict.
         """
+        return dict(self._parse_cached(filename))
+    
+    def _parse_uncached(self, filename: str) -> Dict[str, Any]:
+        """Extension dispatch behind parse()"""
         filename_lower = filename.lower()
         
         if filename_lower.endswith('.s40'):
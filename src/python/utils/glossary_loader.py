@@ -3,19 +3,28 @@ Glossary Loader utility
 Loads and manages glossary mappings for protection functions
 """
 
-import json
 import re
+from collections import defaultdict
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
+
+from .json_io import load_json_file
 
 
 class GlossaryLoader:
     """Loads and provides access to glossary mappings"""
     
+    # Alphanumeric relay code inside a model name (SEPAM S40 -> S40)
+    _RELAY_CODE_RE = re.compile(r'([A-Z]\d+)')
+    
     def __init__(self, glossary_dir: str):
         self.glossary_dir = Path(glossary_dir)
         self.mappings: Dict[str, Any] = {}
         self.relay_configs: Dict[str, Any] = {}
+        # Derived views of self.mappings, built once after loading
+        self._ansi_map: Dict[str, str] = {}
+        self._by_ansi: Dict[str, List[str]] = {}
         self._load_glossaries()
     
     def _load_glossaries(self):
@@ -23,14 +32,31 @@ class GlossaryLoader:
         # Load glossary mapping
         glossary_file = self.glossary_dir / "glossary_mapping.json"
         if glossary_file.exists():
-            with open(glossary_file, 'r', encoding='utf-8') as f:
-                self.mappings = json.load(f)
+            self.mappings = load_json_file(glossary_file)
         
         # Load relay models config
         relay_config_file = self.glossary_dir / "relay_models_config.json"
         if relay_config_file.exists():
-            with open(relay_config_file, 'r', encoding='utf-8') as f:
-                self.relay_configs = json.load(f)
+            self.relay_configs = load_json_file(relay_config_file)
+        
+        self._build_ansi_indexes()
+        # Known models longest first, so the prefix fallback returns the longest match
+        self._relay_prefixes = sorted(
+            self.relay_configs.get('relay_types', {}).items(), key=lambda kv: -len(kv[0])
+        )
+        # Fresh per-instance memo for get_relay_type (model names repeat across a batch)
+        self._relay_type_cache = lru_cache(maxsize=256)(self._lookup_relay_type)
+    
+    def _build_ansi_indexes(self):
+        """Build code -> ANSI and ANSI -> codes indexes in a single pass over the mappings"""
+        ansi_map = {}
+        by_ansi = defaultdict(list)
+        for code, data in self.mappings.items():
+            if isinstance(data, dict) and 'ansi_code' in data:
+                ansi_map[code] = data['ansi_code']
+                by_ansi[data['ansi_code']].append(code)
+        self._ansi_map = ansi_map
+        self._by_ansi = dict(by_ansi)
     
     def get_function_name(self, code: str) -> Optional[str]:
         """Get function name from code"""
@@ -53,12 +79,8 @@ class GlossaryLoader:
         return self.relay_configs.get(model)
     
     def get_all_ansi_codes(self) -> Dict[str, str]:
-        """Get mapping of all codes to ANSI codes"""
-        ansi_map = {}
-        for code, data in self.mappings.items():
-            if 'ansi_code' in data:
-                ansi_map[code] = data['ansi_code']
-        return ansi_map
+        """Get mapping of all codes to ANSI codes (shared index; do not modify)"""
+        return self._ansi_map
     
     def is_code_mapped(self, code: str) -> bool:
         """Check if code exists in mappings"""
@@ -77,17 +99,17 @@ class GlossaryLoader:
     
     def get_codes_by_ansi(self, ansi_code: str) -> list:
         """Get all internal codes that map to an ANSI code"""
-        codes = []
-        for code, data in self.mappings.items():
-            if data.get('ansi_code') == ansi_code:
-                codes.append(code)
-        return codes
+        return list(self._by_ansi.get(ansi_code, []))
     
     def get_relay_type(self, model: str) -> str:
         """
         Get relay type (protection category) from model name
         Returns 'Tipo Desconhecido' if model not found
         """
+        return self._relay_type_cache(model)
+    
+    def _lookup_relay_type(self, model: str) -> str:
+        """Uncached get_relay_type lookup"""
         # Normalize model name
         # Remove: underscore, spaces, "SEPAM", "MICON", etc
         normalized = model.replace('_', '').replace(' ', '').upper()
@@ -98,13 +120,13 @@ class GlossaryLoader:
         if normalized in relay_types:
             return relay_types[normalized]
         
-        # Try prefix match (P122_52 -> P122, S40_V1 -> S40)
-        for known_model, relay_type in relay_types.items():
+        # Try prefix match, longest known model first (P122_52 -> P122, S40_V1 -> S40)
+        for known_model, relay_type in self._relay_prefixes:
             if normalized.startswith(known_model):
                 return relay_type
         
         # Try extracting just the alphanumeric code (SEPAM S40 -> S40)
-        match = re.search(r'([A-Z]\d+)', normalized)
+        match = self._RELAY_CODE_RE.search(normalized)
         if match:
             code = match.group(1)
             if code in relay_types:
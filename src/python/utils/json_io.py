@@ -0,0 +1,34 @@
+"""
+JSON I/O helpers
+Shared bytes-in/bytes-out JSON functions; orjson when installed, stdlib json otherwise
+"""
+
+import json
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def json_loads(data: bytes) -> Any:
+    """Parse JSON bytes (orjson when installed)"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes (orjson when installed); indent=True pretty-prints"""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
+
+
+def load_json_file(path: Path) -> Any:
+    """Parse a JSON file (orjson when installed)"""
+    return json_loads(path.read_bytes())
@@ -5,10 +5,15 @@ Provides structured logging with file and console output
 
 import logging
 import sys
+from logging.handlers import MemoryHandler
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
 
+# Records buffered in memory before a write (WARNING and above flush immediately);
+# kept small so a hard kill loses at most a few lines of the log file
+LOG_BUFFER_CAPACITY = 64
+
 
 class PipelineLogger:
     """Centralized logger for the entire pipeline"""
@@ -17,7 +22,13 @@ class PipelineLogger:
         self.logger = logging.getLogger(name)
         self.logger.setLevel(logging.DEBUG)
         
-        # Remove existing handlers
+        # Remove existing handlers (closing flushes any buffered records)
+        for handler in self.logger.handlers:
+            # MemoryHandler.close() flushes but leaves its file handler open
+            target = getattr(handler, 'target', None)
+            handler.close()
+            if target is not None:
+                target.close()
         self.logger.handlers = []
         
         # Create formatters
@@ -37,7 +48,7 @@ class PipelineLogger:
         console_handler.setFormatter(simple_formatter)
         self.logger.addHandler(console_handler)
         
-        # File handler (DEBUG and above)
+        # File handler (DEBUG and above): one file per run, opened on first write, behind a memory buffer
         if log_dir:
             log_path = Path(log_dir)
             log_path.mkdir(parents=True, exist_ok=True)
@@ -45,10 +56,18 @@ class PipelineLogger:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
             log_file = log_path / f"pipeline_{timestamp}.log"
             
-            file_handler = logging.FileHandler(log_file, encoding='utf-8')
+            file_handler = logging.FileHandler(log_file, encoding='utf-8', delay=True)
             file_handler.setLevel(logging.DEBUG)
             file_handler.setFormatter(detailed_formatter)
-            self.logger.addHandler(file_handler)
+            
+            buffered_handler = MemoryHandler(
+                capacity=LOG_BUFFER_CAPACITY,
+                flushLevel=logging.WARNING,
+                target=file_handler
+            )
+            buffered_handler.setLevel(logging.DEBUG)
+            # logging.shutdown() at exit closes the buffer, then the file handler
+            self.logger.addHandler(buffered_handler)
             
             self.logger.info(f"Log file created: {log_file}")
     
@@ -9,16 +9,26 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.python.extractors.pdf_extractor import PdfExtractor
 
-ext = PdfExtractor()
+# Cache em disco do texto extraído (o mesmo de test_full_extraction.py)
+text_cache_dir = str(Path(__file__).parent.parent / 'outputs' / '.test-cache')
+ext = PdfExtractor(text_cache_dir=text_cache_dir)
 text = ext.extract_text('inputs/pdf/P_122 52-MF-03B1_2021-03-17.pdf')
-lines = text.split('\n')
+lines = text.splitlines()
 
-print(f"Total de linhas no PDF: {len(lines)}")
-print(f"Linhas não vazias: {len([l for l in lines if l.strip()])}")
+# Linhas não vazias, linhas com código e continuações: cada contagem é um finditer
+# sobre o texto inteiro (o laço roda no motor de regex, não linha a linha em Python)
+NON_EMPTY_LINE = re.compile(r'(?m)^[^\S\n]*\S')
+CODE_LINE = re.compile(r'(?m)^[^\S\n]*(\d{4}:[^\n]*)')
+# Linha de código seguida de uma linha não vazia que não começa com código
+CODE_WITH_CONTINUATION = re.compile(
+    r'(?m)^[^\S\n]*(\d{4}:[^\n]*)\n(?![^\S\n]*\d{4}:)([^\n]*\S[^\n]*)'
+)
+
+non_empty = sum(1 for _ in NON_EMPTY_LINE.finditer(text))
+code_lines = [m.group(1).strip() for m in CODE_LINE.finditer(text)]
 
-# Contar linhas com códigos
-pattern = re.compile(r'^\d{4}:')
-code_lines = [l.strip() for l in lines if pattern.match(l.strip())]
+print(f"Total de linhas no PDF: {len(lines)}")
+print(f"Linhas não vazias: {non_empty}")
 
 print(f"\nLinhas com código (0xxx:): {len(code_lines)}")
 print(f"Códigos únicos: {len(set([l[:4] for l in code_lines]))}")
@@ -31,16 +41,12 @@ for i, line in enumerate(code_lines[:20], 1):
 # Verificar se alguma tem continuação multi-linha
 print("\n--- Verificando continuações ---")
 has_continuation = 0
-for i, line in enumerate(lines):
-    if pattern.match(line.strip()):
-        # Check next line
-        if i+1 < len(lines):
-            next_line = lines[i+1].strip()
-            if next_line and not pattern.match(next_line):
-                if 'easergy' not in next_line.lower() and 'page' not in next_line.lower():
-                    has_continuation += 1
-                    if has_continuation <= 5:
-                        print(f"\nCódigo: {line.strip()[:60]}")
-                        print(f"  → Cont: {next_line[:60]}")
+for m in CODE_WITH_CONTINUATION.finditer(text):
+    next_line = m.group(2).strip()
+    if 'easergy' not in next_line.lower() and 'page' not in next_line.lower():
+        has_continuation += 1
+        if has_continuation <= 5:
+            print(f"\nCódigo: {m.group(1).strip()[:60]}")
+            print(f"  → Cont: {next_line[:60]}")
 
 print(f"\nTotal com continuação: {has_continuation}")
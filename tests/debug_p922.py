@@ -11,7 +11,9 @@ from src.python.extractors.pdf_extractor import PdfExtractor
 
 # Test P922 extraction
 pdf_file = "inputs/pdf/P922 52-MF-01BC.pdf"
-extractor = PdfExtractor()
+# Disk cache for the extracted text (same as test_full_extraction.py)
+text_cache_dir = str(Path(__file__).parent.parent / 'outputs' / '.test-cache')
+extractor = PdfExtractor(text_cache_dir=text_cache_dir)
 
 print("\n=== P922 PDF Extraction Test ===")
 print(f"File: {pdf_file}")
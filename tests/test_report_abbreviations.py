@@ -0,0 +1,60 @@
+"""
+Test Report Abbreviations
+Valida que os mapeamentos de abreviação de headers não têm chaves duplicadas
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.python.reporters.report_generator import ReportGenerator, _mapping_from_pairs
+
+
+def test_duplicate_keys_rejected():
+    """Pares com chave repetida devem gerar erro em vez de sobrescrever"""
+    print("\n" + "=" * 80)
+    print("TESTING DUPLICATE KEY DETECTION")
+    print("=" * 80)
+    
+    try:
+        _mapping_from_pairs([('Código da Subestação', 'Cd.Subest'), ('Código da Subestação', 'SE')])
+    except ValueError as e:
+        print(f"  ✓ Duplicate rejected: {e}")
+    else:
+        raise AssertionError("duplicate key was accepted")
+
+
+def test_header_abbreviations():
+    """Abreviações efetivas continuam as mesmas do dicionário original"""
+    print("\n" + "=" * 80)
+    print("TESTING HEADER ABBREVIATIONS")
+    print("=" * 80)
+    
+    abbreviations = ReportGenerator.HEADER_ABBREVIATIONS
+    
+    expected = {
+        'Código da Subestação': 'SE',
+        'Proteções Habilitadas': 'Prot\nHabil',
+        'Data de Configuração': 'Data\nConfig',
+        'Versão de Software': 'Ver.\nSW',
+        'Versão de Firmware': 'Ver.\nFW',
+    }
+    
+    for key, value in expected.items():
+        actual = abbreviations.get(key)
+        print(f"  {key!r} -> {actual!r}")
+        assert actual == value, f"{key}: {actual!r} != {value!r}"
+    
+    print(f"  ✓ {len(abbreviations)} abbreviations, no duplicates")
+
+
+if __name__ == '__main__':
+    test_duplicate_keys_rejected()
+    test_header_abbreviations()
+    
+    print("\n" + "=" * 80)
+    print("REPORT ABBREVIATION TESTS COMPLETED")
+    print("=" * 80)